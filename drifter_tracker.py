@@ -7,7 +7,11 @@ A desktop application for tracking Jove Observatory drifter wormholes
 import sys
 import json
 import os
+import re
+from collections import defaultdict
 from datetime import datetime, timedelta
+from itertools import groupby
+from operator import itemgetter
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QComboBox, QTextEdit, QPushButton, QListWidget, QListWidgetItem,
@@ -17,7 +21,74 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QSettings, QTimer, QSize
 from PyQt6.QtGui import QFont, QColor, QPalette
 
-from jove_systems import JOVE_SYSTEMS
+from jove_systems import JOVE_SYSTEMS, JOVE_REGION_SIZES
+
+
+# Scan bulk import patterns (compiled once, used per pasted line)
+_ENTRY_SPLIT_RE = re.compile(r'(?=\b[A-Z0-9]+-[A-Z0-9]+\s*(?:\([^)]+\))?\s*=>)', re.IGNORECASE)
+_DAYS_AGO_RE = re.compile(r'(\d+)\s+days?\s+ago')
+_HOURS_AGO_RE = re.compile(r'(\d+)\s+hours?\s+ago')
+_MINUTES_AGO_RE = re.compile(r'(\d+)\s+minutes?\s+ago')
+_MARKDOWN_RE = re.compile(r'[*_`~]')
+_SYSTEM_CODE_RE = re.compile(r'\b([A-Z0-9]+-[A-Z0-9]+)\b', re.IGNORECASE)
+_PARENS_RE = re.compile(r'\(([^)]+)\)')
+_LIFE_RE = re.compile(r'Life(?:time)?[:\s]+([^,]+?)(?:,|\s+Mass:)', re.IGNORECASE)
+_MASS_RE = re.compile(r'Mass(?:\s+Stability)?[:\s]+([@A-Za-z0-9%>\s<]+?)(?:\s+(?:remaining|Lifetime|Life|$))', re.IGNORECASE)
+_ROLE_MENTION_RE = re.compile(r'<@&(\d+)>')
+_DRIFTER_HOLE_TYPES = ('Barbican', 'Conflux', 'Vidette', 'Redoubt', 'Sentinel')
+
+# Fleet bulk import patterns
+_WHITESPACE_RE = re.compile(r'\s+')
+_SHIP_UNSAFE_CHARS_RE = re.compile(r'[^\w\s\-]')
+_SHIP_TRAILING_JUNK_RE = re.compile(r'[\d\s\-]+$')
+_SHIP_NAME_RE = re.compile(r'^[A-Za-z][A-Za-z0-9\s\-]*$')
+_FLEET_TAB_RE = re.compile(r'^([A-Za-z\s-]+?)\t+([A-Za-z\s]+?)\t+(\d+)\s*$')
+_FLEET_SPACED_RE = re.compile(r'^([A-Za-z\s-]+?)\s{2,}([A-Za-z\s]+?)\s{2,}(\d+)\s*$')
+_FLEET_NAME_QTY_RE = re.compile(r'^([A-Za-z\s-]+?)\s+(\d+)\s*$')
+_FLEET_NAME_ONLY_RE = re.compile(r'^([A-Z][A-Za-z\s-]+?)$')
+_FLEET_ITEM_RE = re.compile(r'^\d+x\s+(?P<ship>[^(]+?)\s*\(')
+
+# Common ship class keywords (appear after ship name in fleet window)
+_SHIP_CLASS_KEYWORDS = (
+    'Frigate', 'Destroyer', 'Cruiser', 'Battlecruiser', 'Battleship',
+    'Stealth Bomber', 'Force Recon', 'Heavy Assault', 'Heavy Interdictor',
+    'Logistics', 'Recon', 'Command', 'Covert Ops', 'Electronic Attack',
+    'Assault Frigate', 'Strategic Cruiser', 'Black Ops', 'Marauder',
+    'Carrier', 'Dreadnought', 'Force Auxiliary', 'Supercarrier', 'Titan',
+    'Interceptor', 'Combat Interceptor', 'Fleet Interceptor'
+)
+
+# Common role keywords (appear after ship class)
+_FLEET_ROLE_KEYWORDS = ('Squad', 'Wing', 'Fleet', 'Member', 'Commander', 'Leader', 'Boss')
+
+# Dialog stylesheets (shared by the export and bulk import dialogs)
+_DIALOG_TEXT_EDIT_STYLE = """
+    QTextEdit {
+        background: #16161d;
+        border: 1px solid #2a2a35;
+        border-radius: 2px;
+        padding: 15px;
+        color: #e8e8e8;
+        font-family: 'Courier New', monospace;
+        font-size: 12px;
+    }
+"""
+
+_BULK_IMPORT_INSTRUCTIONS_STYLE = """
+    color: #e8e8e8;
+    background: #0e0e14;
+    padding: 15px;
+    border-radius: 2px;
+    border: 1px solid #2a2a35;
+"""
+
+_FLEET_IMPORT_INSTRUCTIONS_STYLE = """
+    color: #e8e8e8;
+    background: #16161d;
+    padding: 15px;
+    border-radius: 2px;
+    border: 1px solid #2a2a35;
+"""
 
 
 class DrifterTracker(QMainWindow):
@@ -993,7 +1064,7 @@ class DrifterTracker(QMainWindow):
         self.region_combo.addItem('Select Region')
         
         for region in sorted(JOVE_SYSTEMS.keys()):
-            total_systems = len(JOVE_SYSTEMS[region])
+            total_systems = JOVE_REGION_SIZES[region]
             
             # Count systems with scans in this region
             systems_scanned = set()
@@ -1033,7 +1104,6 @@ class DrifterTracker(QMainWindow):
 
     def process_bulk_import(self, import_text):
         """Process bulk import text and add scans"""
-        import re
         from datetime import datetime, timedelta
         
         lines = import_text.strip().split('\n')
@@ -1045,7 +1115,7 @@ class DrifterTracker(QMainWindow):
             if line.count('=>') > 1:
                 # Split by system pattern: SYSTEM (optional region) =>
                 # Look for pattern: word-boundary, system name, optional space/paren/region, =>
-                parts = re.split(r'(?=\b[A-Z0-9]+-[A-Z0-9]+\s*(?:\([^)]+\))?\s*=>)', line, flags=re.IGNORECASE)
+                parts = _ENTRY_SPLIT_RE.split(line)
                 for part in parts:
                     part = part.strip()
                     if part and '=>' in part:
@@ -1066,17 +1136,17 @@ class DrifterTracker(QMainWindow):
             if 'Scan was completed' in line:
                 # Try to parse relative time
                 if 'days ago' in line:
-                    days_match = re.search(r'(\d+)\s+days?\s+ago', line)
+                    days_match = _DAYS_AGO_RE.search(line)
                     if days_match:
                         days_ago = int(days_match.group(1))
                         scan_timestamp = datetime.now() - timedelta(days=days_ago)
                 elif 'hours ago' in line:
-                    hours_match = re.search(r'(\d+)\s+hours?\s+ago', line)
+                    hours_match = _HOURS_AGO_RE.search(line)
                     if hours_match:
                         hours_ago = int(hours_match.group(1))
                         scan_timestamp = datetime.now() - timedelta(hours=hours_ago)
                 elif 'minutes ago' in line:
-                    minutes_match = re.search(r'(\d+)\s+minutes?\s+ago', line)
+                    minutes_match = _MINUTES_AGO_RE.search(line)
                     if minutes_match:
                         minutes_ago = int(minutes_match.group(1))
                         scan_timestamp = datetime.now() - timedelta(minutes=minutes_ago)
@@ -1120,8 +1190,8 @@ class DrifterTracker(QMainWindow):
             right = parts[1].strip()
             
             # Clean up any formatting characters
-            left = re.sub(r'[*_`~]', '', left)  # Remove markdown
-            right = re.sub(r'[*_`~]', '', right)  # Remove markdown
+            left = _MARKDOWN_RE.sub('', left)  # Remove markdown
+            right = _MARKDOWN_RE.sub('', right)  # Remove markdown
             
             # Extract SYSTEM from left side
             # System format: "SYSTEM" or "SYSTEM (Region)"
@@ -1130,12 +1200,12 @@ class DrifterTracker(QMainWindow):
             
             # Try to find system code - nullsec format: any alphanumeric with dash
             # Examples: L-1SW8, 2PQU-5, EKPB-3, 92K-H2, 6F-H3W
-            system_match = re.search(r'\b([A-Z0-9]+-[A-Z0-9]+)\b', left, re.IGNORECASE)
+            system_match = _SYSTEM_CODE_RE.search(left)
             if system_match:
                 system = system_match.group(1).upper()
             
             # Try to find region in parentheses
-            region_match = re.search(r'\(([^)]+)\)', left)
+            region_match = _PARENS_RE.search(left)
             if region_match:
                 potential = region_match.group(1).strip()
                 if potential in JOVE_SYSTEMS:
@@ -1167,14 +1237,15 @@ class DrifterTracker(QMainWindow):
             hole_type = None
             
             # Check common types
-            for wh_type in ['Barbican', 'Conflux', 'Vidette', 'Redoubt', 'Sentinel']:
-                if wh_type.lower() in right.lower():
+            right_lower = right.lower()
+            for wh_type in _DRIFTER_HOLE_TYPES:
+                if wh_type.lower() in right_lower:
                     hole_type = wh_type
                     break
             
             # If not found, look in parentheses
             if not hole_type:
-                paren_match = re.search(r'\(([^)]+)\)', right)
+                paren_match = _PARENS_RE.search(right)
                 if paren_match:
                     hole_type = paren_match.group(1).strip()
             
@@ -1193,7 +1264,7 @@ class DrifterTracker(QMainWindow):
             # Extract LIFE status
             life_status = 'Fresh'
             # Look for "Life:" keyword - simpler, more robust regex
-            life_match = re.search(r'Life(?:time)?[:\s]+([^,]+?)(?:,|\s+Mass:)', right, re.IGNORECASE)
+            life_match = _LIFE_RE.search(right)
             if life_match:
                 life_text = life_match.group(1).strip().replace('@', '').strip()
                 
@@ -1209,7 +1280,7 @@ class DrifterTracker(QMainWindow):
             # Extract MASS status
             mass_status = '100% > 50%'
             # Look for Mass or "Mass Stability:" followed by percentage/description
-            mass_match = re.search(r'Mass(?:\s+Stability)?[:\s]+([@A-Za-z0-9%>\s<]+?)(?:\s+(?:remaining|Lifetime|Life|$))', right, re.IGNORECASE)
+            mass_match = _MASS_RE.search(right)
             if mass_match:
                 mass_text = mass_match.group(1).strip().replace('@', '').strip()
                 
@@ -1227,7 +1298,7 @@ class DrifterTracker(QMainWindow):
                     # Otherwise keep default
             
             # Extract role ID if present
-            role_match = re.search(r'<@&(\d+)>', line)
+            role_match = _ROLE_MENTION_RE.search(line)
             role_id = role_match.group(1) if role_match else ''
             
             # Calculate actual wormhole spawn time based on life status
@@ -1694,15 +1765,9 @@ class DrifterTracker(QMainWindow):
             return
         
         # Group by region, then by system
-        by_region = {}
+        by_region = defaultdict(lambda: defaultdict(list))
         for scan in self.scans:
-            region = scan['region']
-            system = scan['system']
-            if region not in by_region:
-                by_region[region] = {}
-            if system not in by_region[region]:
-                by_region[region][system] = []
-            by_region[region][system].append(scan)
+            by_region[scan['region']][scan['system']].append(scan)
         
         # Calculate stats
         total_systems = sum(len(systems) for systems in by_region.values())
@@ -1711,9 +1776,9 @@ class DrifterTracker(QMainWindow):
         self.update_stats(total_systems, holes_found, regions_count)
         
         # Add region groups
-        for region in sorted(by_region.keys()):
+        for region in sorted(by_region):
             systems_dict = by_region[region]
-            total_in_region = len(JOVE_SYSTEMS[region])
+            total_in_region = JOVE_REGION_SIZES[region]
             scanned_in_region = len(systems_dict)
             is_complete = scanned_in_region == total_in_region
             status = '[COMPLETE]' if is_complete else '[INCOMPLETE]'
@@ -1739,7 +1804,7 @@ class DrifterTracker(QMainWindow):
                 self.scans_list.addItem(system_item)
                 
                 # Individual wormholes - each on its own row with a delete button
-                for scan in sorted(scans, key=lambda s: s['scannedAt'], reverse=True):
+                for scan in sorted(scans, key=itemgetter('scannedAt'), reverse=True):
                     hole_display = 'No Hole' if scan['holeType'] == 'None' else scan['holeType']
                     scanned_time = datetime.fromisoformat(scan['scannedAt']).strftime('%Y-%m-%d %H:%M')
                     
@@ -2229,7 +2294,7 @@ class DrifterTracker(QMainWindow):
                 })
         
         # Sort by score (lower is better)
-        routes.sort(key=lambda r: r['score'])
+        routes.sort(key=itemgetter('score'))
         
         return routes
     
@@ -2537,10 +2602,17 @@ class DrifterTracker(QMainWindow):
         # Check if multi-hop is enabled
         allow_multihop = True  # Multi-hop always enabled
         
+        # Shortest paths for every leg up front: one search out of the origin,
+        # one search back from the destination
+        exit_systems = {exit_system for targets in connections.values() for exit_system, _ in targets}
+        entry_paths = self.sde_loader.find_paths(origin, wormhole_systems, max_jumps=max_gates_per_leg)
+        exit_paths = self.sde_loader.find_paths(destination, exit_systems, max_jumps=max_gates_per_leg,
+                                                reverse=True)
+        
         # Single-hop routes (1 wormhole)
         for entry_system in wormhole_systems:
             # Calculate path from origin to wormhole entry
-            entry_path = self.sde_loader.find_path(origin, entry_system, max_jumps=max_gates_per_leg)
+            entry_path = entry_paths[entry_system]
             
             if not entry_path:
                 continue
@@ -2550,7 +2622,7 @@ class DrifterTracker(QMainWindow):
             # For each system this wormhole connects to
             for exit_system, wh_data in connections[entry_system]:
                 # Calculate path from wormhole exit to destination
-                exit_path = self.sde_loader.find_path(exit_system, destination, max_jumps=max_gates_per_leg)
+                exit_path = exit_paths[exit_system]
                 
                 if not exit_path:
                     continue
@@ -2583,7 +2655,7 @@ class DrifterTracker(QMainWindow):
             print("Calculating multi-hop routes...")
             for entry_system in wormhole_systems:
                 # Path from origin to first wormhole
-                entry_path = self.sde_loader.find_path(origin, entry_system, max_jumps=max_gates_per_leg)
+                entry_path = entry_paths[entry_system]
                 
                 if not entry_path:
                     continue
@@ -2611,7 +2683,7 @@ class DrifterTracker(QMainWindow):
                             continue
                         
                         # Path from second wormhole exit to destination
-                        exit_path = self.sde_loader.find_path(exit_system, destination, max_jumps=max_gates_per_leg)
+                        exit_path = exit_paths[exit_system]
                         
                         if not exit_path:
                             continue
@@ -2621,7 +2693,7 @@ class DrifterTracker(QMainWindow):
                         
                         # Don't show multi-hop if it makes route significantly worse (10+ gates)
                         # Calculate best single-hop alternative
-                        direct_route_1 = self.sde_loader.find_path(mid_system, destination, max_jumps=max_gates_per_leg)
+                        direct_route_1 = exit_paths[mid_system]
                         direct_route_1_gates = entry_gates + (len(direct_route_1) - 1 if direct_route_1 else 999)
                         
                         # If multi-hop is 10+ gates worse than single-hop, skip it
@@ -2656,7 +2728,7 @@ class DrifterTracker(QMainWindow):
                         })
         
         # Sort by score (lower is better)
-        routes.sort(key=lambda r: r['score'])
+        routes.sort(key=itemgetter('score'))
         
         print(f"Found {len(routes)} routes ({sum(1 for r in routes if r['wormhole_count'] == 2)} multi-hop)")
         return routes
@@ -3079,7 +3151,7 @@ class DrifterTracker(QMainWindow):
             routes.sort(key=lambda r: (len(r), self.count_risky_holes(r, connections)))
         else:
             # Dodgy: just shortest, doesn't care about hole condition
-            routes.sort(key=lambda r: len(r))
+            routes.sort(key=len)
         
         return routes
     
@@ -3407,7 +3479,7 @@ class DrifterTracker(QMainWindow):
         self.ship_type_combo.addItem("Select Ship Type")
         
         # Add ALL subcapital ships from SDE (sorted alphabetically)
-        all_ships = sorted(self.sde_loader.ship_masses.keys())
+        all_ships = self.sde_loader.ship_names
         for ship in all_ships:
             self.ship_type_combo.addItem(ship, ship)
         
@@ -3520,7 +3592,8 @@ class DrifterTracker(QMainWindow):
         layout.addWidget(analysis_group)
         
         # Initialize fleet composition
-        self.fleet_composition = {}  # {ship_type: quantity}
+        self.fleet_composition = defaultdict(int)  # {ship_type: quantity}
+        self._fleet_dirty = True  # Set on every fleet change, cleared by update_fleet_display
         
         return widget
     
@@ -3538,10 +3611,8 @@ class DrifterTracker(QMainWindow):
             return
         
         # Add to fleet composition
-        if ship_type in self.fleet_composition:
-            self.fleet_composition[ship_type] += quantity
-        else:
-            self.fleet_composition[ship_type] = quantity
+        self.fleet_composition[ship_type] += quantity
+        self._fleet_dirty = True
         
         # Update display
         self.update_fleet_display()
@@ -3551,9 +3622,13 @@ class DrifterTracker(QMainWindow):
     
     def update_fleet_display(self):
         """Update fleet composition display and mass analysis"""
-        self.fleet_list.clear()
+        # Nothing changed since the last refresh
+        if not self._fleet_dirty:
+            return
+        self._fleet_dirty = False
         
         if not self.fleet_composition:
+            self.fleet_list.clear()
             self.mass_analysis_label.setText("Add ships to see mass analysis")
             return
         
@@ -3561,23 +3636,32 @@ class DrifterTracker(QMainWindow):
         total_mass = 0
         total_ships = 0
         
-        for ship_type, quantity in sorted(self.fleet_composition.items()):
-            ship_mass = self.sde_loader.ship_masses.get(ship_type, 0)
-            total_ship_mass = ship_mass * quantity
-            total_mass += total_ship_mass
-            total_ships += quantity
+        # Repopulate without a repaint/signal per item
+        self.fleet_list.setUpdatesEnabled(False)
+        self.fleet_list.blockSignals(True)
+        try:
+            self.fleet_list.clear()
             
-            item = QListWidgetItem(f"{quantity}x {ship_type} ({ship_mass:,} kg each) = {total_ship_mass:,} kg")
-            self.fleet_list.addItem(item)
-        
-        # Add totals
-        self.fleet_list.addItem(QListWidgetItem(""))
-        total_item = QListWidgetItem(f"📊 Total: {total_ships} ships, {total_mass:,} kg")
-        font = total_item.font()
-        font.setBold(True)
-        total_item.setFont(font)
-        total_item.setForeground(QColor('#e8e8e8'))
-        self.fleet_list.addItem(total_item)
+            for ship_type, quantity in sorted(self.fleet_composition.items()):
+                ship_mass = self.sde_loader.ship_masses.get(ship_type, 0)
+                total_ship_mass = ship_mass * quantity
+                total_mass += total_ship_mass
+                total_ships += quantity
+                
+                item = QListWidgetItem(f"{quantity}x {ship_type} ({ship_mass:,} kg each) = {total_ship_mass:,} kg")
+                self.fleet_list.addItem(item)
+            
+            # Add totals
+            self.fleet_list.addItem(QListWidgetItem(""))
+            total_item = QListWidgetItem(f"📊 Total: {total_ships} ships, {total_mass:,} kg")
+            font = total_item.font()
+            font.setBold(True)
+            total_item.setFont(font)
+            total_item.setForeground(QColor('#e8e8e8'))
+            self.fleet_list.addItem(total_item)
+        finally:
+            self.fleet_list.blockSignals(False)
+            self.fleet_list.setUpdatesEnabled(True)
         
         # Update mass analysis
         self.update_mass_analysis(total_mass)
@@ -3639,6 +3723,7 @@ class DrifterTracker(QMainWindow):
     def clear_fleet(self):
         """Clear fleet composition"""
         self.fleet_composition.clear()
+        self._fleet_dirty = True
         self.update_fleet_display()
     
     def show_fleet_bulk_import(self):
@@ -3656,7 +3741,6 @@ class DrifterTracker(QMainWindow):
     
     def process_fleet_bulk_import(self, import_text):
         """Parse and import fleet composition from EVE fleet window"""
-        import re
         from security_utils import SecurityValidator
         
         lines = import_text.strip().split('\n')
@@ -3671,7 +3755,7 @@ class DrifterTracker(QMainWindow):
                     continue
             
                 # Clean up common EVE fleet formatting
-                line = re.sub(r'\s+', ' ', line)  # Normalize whitespace
+                line = _WHITESPACE_RE.sub(' ', line)  # Normalize whitespace
             
                 ship_type = None
                 quantity = 1  # Default to 1 if no quantity found
@@ -3681,25 +3765,12 @@ class DrifterTracker(QMainWindow):
                 # Example: "Ultra PUIG-F Manticore Stealth Bomber Fleet Commander"
                 #                         ^^^^^^^^^ Extract this
             
-                # Common ship class keywords (appear after ship name)
-                ship_class_keywords = [
-                    'Frigate', 'Destroyer', 'Cruiser', 'Battlecruiser', 'Battleship',
-                    'Stealth Bomber', 'Force Recon', 'Heavy Assault', 'Heavy Interdictor',
-                    'Logistics', 'Recon', 'Command', 'Covert Ops', 'Electronic Attack',
-                    'Assault Frigate', 'Strategic Cruiser', 'Black Ops', 'Marauder',
-                    'Carrier', 'Dreadnought', 'Force Auxiliary', 'Supercarrier', 'Titan',
-                    'Interceptor', 'Combat Interceptor', 'Fleet Interceptor'
-                ]
-            
-                # Common role keywords (appear after ship class)
-                role_keywords = ['Squad', 'Wing', 'Fleet', 'Member', 'Commander', 'Leader', 'Boss']
-            
                 # SECURITY: Limit line length
                 if len(line) > SecurityValidator.MAX_INPUT_TEXT_LENGTH:
                     continue
             
                 # Strategy: Find ship class keyword, extract word before it
-                for ship_class in ship_class_keywords:
+                for ship_class in _SHIP_CLASS_KEYWORDS:
                     idx = line.find(ship_class)
                     if idx > 0:
                         # Found ship class - ship name is the word immediately before it
@@ -3716,10 +3787,10 @@ class DrifterTracker(QMainWindow):
                                 continue
                         
                             # SECURITY: Remove dangerous chars
-                            ship_type = re.sub(r'[^\w\s\-]', '', ship_type).strip()
+                            ship_type = _SHIP_UNSAFE_CHARS_RE.sub('', ship_type).strip()
                         
                             # SECURITY: Validate format
-                            if ship_type and re.match(r'^[A-Za-z][A-Za-z0-9\s\-]*$', ship_type):
+                            if ship_type and _SHIP_NAME_RE.match(ship_type):
                                 break  # Found valid ship name
                             else:
                                 ship_type = None
@@ -3727,7 +3798,7 @@ class DrifterTracker(QMainWindow):
                 # If no ship class found, try finding role keywords (less reliable)
                 if not ship_type:
                     found_keyword_at = -1
-                    for keyword in role_keywords:
+                    for keyword in _FLEET_ROLE_KEYWORDS:
                         idx = line.find(keyword)
                         if idx > 0 and idx < 200:  # SECURITY: Limit
                             if found_keyword_at == -1 or idx < found_keyword_at:
@@ -3746,39 +3817,39 @@ class DrifterTracker(QMainWindow):
                     
                         if ship_type:
                             # SECURITY: Sanitize
-                            ship_type = re.sub(r'[\d\s\-]+$', '', ship_type).strip()
-                            ship_type = re.sub(r'[^\w\s\-]', '', ship_type).strip()
+                            ship_type = _SHIP_TRAILING_JUNK_RE.sub('', ship_type).strip()
+                            ship_type = _SHIP_UNSAFE_CHARS_RE.sub('', ship_type).strip()
                         
                             # SECURITY: Validate
                             if not ship_type or len(ship_type) < 3 or len(ship_type) > 50:
                                 ship_type = None
-                            elif not re.match(r'^[A-Za-z][A-Za-z0-9\s\-]*$', ship_type):
+                            elif not _SHIP_NAME_RE.match(ship_type):
                                 ship_type = None
             
                 # Pattern 2: "Hound	Stealth Bomber	9" (Fleet Composition tab with tabs)
                 if not ship_type:
-                    tab_match = re.search(r'^([A-Za-z\s-]+?)\t+([A-Za-z\s]+?)\t+(\d+)\s*$', line)
+                    tab_match = _FLEET_TAB_RE.search(line)
                     if tab_match:
                         ship_type = tab_match.group(1).strip()
                         quantity = int(tab_match.group(3))
             
                 # Pattern 3: "Hound  Stealth Bomber  9" (with spaces)
                 if not ship_type:
-                    space_match = re.search(r'^([A-Za-z\s-]+?)\s{2,}([A-Za-z\s]+?)\s{2,}(\d+)\s*$', line)
+                    space_match = _FLEET_SPACED_RE.search(line)
                     if space_match:
                         ship_type = space_match.group(1).strip()
                         quantity = int(space_match.group(3))
             
                 # Pattern 4: "Redeemer 10" (ship name and number)
                 if not ship_type:
-                    simple_match = re.search(r'^([A-Za-z\s-]+?)\s+(\d+)\s*$', line)
+                    simple_match = _FLEET_NAME_QTY_RE.search(line)
                     if simple_match:
                         ship_type = simple_match.group(1).strip()
                         quantity = int(simple_match.group(2))
             
                 # Pattern 5: Just ship name "Redeemer" (quantity defaults to 1)
                 if not ship_type:
-                    name_only = re.match(r'^([A-Z][A-Za-z\s-]+?)$', line)
+                    name_only = _FLEET_NAME_ONLY_RE.match(line)
                     if name_only:
                         ship_type = name_only.group(1).strip()
                         quantity = 1
@@ -3790,30 +3861,19 @@ class DrifterTracker(QMainWindow):
                     # Clean up ship name
                     ship_type = ship_type.strip()
                 
-                    # Look up ship mass
-                    if ship_type in self.sde_loader.ship_masses:
-                        if ship_type in self.fleet_composition:
-                            self.fleet_composition[ship_type] += quantity
-                        else:
-                            self.fleet_composition[ship_type] = quantity
+                    # Look up ship mass (exact match, then case-insensitive)
+                    known_ship = self.sde_loader.get_ship_name(ship_type)
+                    if not known_ship:
+                        # Multi-word names (e.g. "Megathron Federate Issue") get cut
+                        # by the heuristics above - look for any known ship in the line
+                        known_ship = self.sde_loader.find_ship_in_text(line)
+                    if known_ship:
+                        ship_type = known_ship  # Use correct case
+                        self.fleet_composition[ship_type] += quantity
+                        self._fleet_dirty = True
                         ships_added += quantity
                     else:
-                        # Try case-insensitive match
-                        matched = False
-                        ship_lower = ship_type.lower()
-                        for known_ship in self.sde_loader.ship_masses.keys():
-                            if known_ship.lower() == ship_lower:
-                                ship_type = known_ship  # Use correct case
-                                if ship_type in self.fleet_composition:
-                                    self.fleet_composition[ship_type] += quantity
-                                else:
-                                    self.fleet_composition[ship_type] = quantity
-                                ships_added += quantity
-                                matched = True
-                                break
-                    
-                        if not matched:
-                            errors.append(f"Unknown ship: {ship_type}")
+                        errors.append(f"Unknown ship: {ship_type}")
             except Exception as e:
                 # Skip problematic lines
                 errors.append(f"Parse error: {str(e)[:50]}")
@@ -3843,12 +3903,13 @@ class DrifterTracker(QMainWindow):
         if not item:
             return
         
-        # Extract ship type from item text
-        text = item.text()
-        if 'x' not in text or '=' in text and 'Total' in text:
+        # Extract ship type from item text: "3x Hound (1,000 kg each) = ..."
+        # (the blank spacer and total rows don't match)
+        match = _FLEET_ITEM_RE.match(item.text())
+        if not match:
             return
         
-        ship_type = text.split('x')[1].split('(')[0].strip()
+        ship_type = match.group('ship')
         
         menu = QMenu()
         remove_action = menu.addAction(f"Remove {ship_type}")
@@ -3858,6 +3919,7 @@ class DrifterTracker(QMainWindow):
         if action == remove_action:
             if ship_type in self.fleet_composition:
                 del self.fleet_composition[ship_type]
+                self._fleet_dirty = True
                 self.update_fleet_display()
 
 
@@ -3879,20 +3941,14 @@ class ExportDialog(QDialog):
         
         self.text_edit = QTextEdit()
         self.text_edit.setReadOnly(True)
-        self.text_edit.setStyleSheet("""
-            QTextEdit {
-                background: #16161d;
-                border: 1px solid #2a2a35;
-                border-radius: 2px;
-                padding: 15px;
-                color: #e8e8e8;
-                font-family: 'Courier New', monospace;
-                font-size: 12px;
-            }
-        """)
+        self.text_edit.setStyleSheet(_DIALOG_TEXT_EDIT_STYLE)
         
+        # Plain text only, laid out once after the whole report is set
         report = self.generate_discord_report()
+        self.text_edit.setAcceptRichText(False)
+        self.text_edit.setUpdatesEnabled(False)
         self.text_edit.setPlainText(report)
+        self.text_edit.setUpdatesEnabled(True)
         layout.addWidget(self.text_edit)
         
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok)
@@ -3902,50 +3958,55 @@ class ExportDialog(QDialog):
     def generate_discord_report(self):
         timestamp = int(datetime.now().timestamp())
         
-        # Group by region, then by system
-        by_region = {}
+        # Single pass: scanned systems per region (only counts are needed),
+        # and the actual holes
+        scanned_by_region = defaultdict(set)
+        holes = []
         for scan in self.scans:
-            region = scan['region']
-            system = scan['system']
-            if region not in by_region:
-                by_region[region] = {}
-            if system not in by_region[region]:
-                by_region[region][system] = []
-            by_region[region][system].append(scan)
+            scanned_by_region[scan['region']].add(scan['system'])
+            if scan['holeType'] != 'None':
+                holes.append(scan)
+        
+        # One sort puts holes in report order; groupby then walks them linearly
+        holes.sort(key=itemgetter('region', 'system', 'holeType'))
+        holes_by_region = {
+            region: list(region_holes)
+            for region, region_holes in groupby(holes, key=itemgetter('region'))
+        }
         
         # Count unique systems scanned
-        total_systems = sum(len(systems) for systems in by_region.values())
+        total_systems = sum(len(systems) for systems in scanned_by_region.values())
         
-        report = f'## Scan was completed <t:{timestamp}:R>\n'
-        report += f'# Systems Scanned: {total_systems}\n'
+        lines = [
+            f'## Scan was completed <t:{timestamp}:R>',
+            f'# Systems Scanned: {total_systems}',
+        ]
         
-        for region in sorted(by_region.keys()):
-            systems_dict = by_region[region]
-            total_in_region = len(JOVE_SYSTEMS[region])
-            scanned_in_region = len(systems_dict)
+        # Scans from the same alliance share a role ID - format each mention once
+        role_mentions = {}
+        
+        for region in sorted(scanned_by_region.keys()):
+            total_in_region = JOVE_REGION_SIZES[region]
+            scanned_in_region = len(scanned_by_region[region])
             is_complete = scanned_in_region == total_in_region
             status = '[COMPLETE] Scan' if is_complete else '[INCOMPLETE] Scan'
             
-            # Check if there are any actual holes in this region
-            has_holes = False
-            for system_scans in systems_dict.values():
-                if any(s['holeType'] != 'None' for s in system_scans):
-                    has_holes = True
-                    break
-            
-            if has_holes:
-                report += f'## {region} (Scanned: {scanned_in_region}/{total_in_region}) {status}\n'
+            # Only list regions that have actual holes
+            if region in holes_by_region:
+                lines.append(f'## {region} (Scanned: {scanned_in_region}/{total_in_region}) {status}')
                 
-                for system in sorted(systems_dict.keys()):
-                    system_scans = systems_dict[system]
-                    holes_in_system = [s for s in system_scans if s['holeType'] != 'None']
-                    
-                    if holes_in_system:
-                        for scan in sorted(holes_in_system, key=lambda s: s['holeType']):
-                            role_mention = f"***⁨<@&{scan['roleId']}>⁩***" if scan['roleId'] else '***Drifter Hole***'
-                            report += f"**{system}** => {role_mention} ({scan['holeType']}), **Life:** *{scan['lifeStatus']}*, **Mass:** *{scan['massStatus']}*\n"
+                for system, system_holes in groupby(holes_by_region[region], key=itemgetter('system')):
+                    for scan in system_holes:
+                        role_id = scan['roleId']
+                        if role_id:
+                            role_mention = role_mentions.get(role_id)
+                            if role_mention is None:
+                                role_mention = role_mentions[role_id] = f"***⁨<@&{role_id}>⁩***"
+                        else:
+                            role_mention = '***Drifter Hole***'
+                        lines.append(f"**{system}** => {role_mention} ({scan['holeType']}), **Life:** *{scan['lifeStatus']}*, **Mass:** *{scan['massStatus']}*")
         
-        return report
+        return '\n'.join(lines) + '\n'
 
     def copy_and_close(self):
         clipboard = QApplication.clipboard()
@@ -3975,13 +4036,7 @@ class BulkImportDialog(QDialog):
             'Example: Cache,M-CNUD,Vidette,Fresh,100% > 50%,1326789530983858256<br><br>'
             '<i>Lines starting with # are ignored. Empty lines are skipped.</i>'
         )
-        instructions.setStyleSheet("""
-            color: #e8e8e8;
-            background: #0e0e14;
-            padding: 15px;
-            border-radius: 2px;
-            border: 1px solid #2a2a35;
-        """)
+        instructions.setStyleSheet(_BULK_IMPORT_INSTRUCTIONS_STYLE)
         instructions.setWordWrap(True)
         layout.addWidget(instructions)
         
@@ -3999,17 +4054,7 @@ class BulkImportDialog(QDialog):
             '# This is a comment\n'
             'Branch,P7Z-R3,Conflux,Critical,< 10%'
         )
-        self.text_edit.setStyleSheet("""
-            QTextEdit {
-                background: #16161d;
-                border: 1px solid #2a2a35;
-                border-radius: 2px;
-                padding: 15px;
-                color: #e8e8e8;
-                font-family: 'Courier New', monospace;
-                font-size: 12px;
-            }
-        """)
+        self.text_edit.setStyleSheet(_DIALOG_TEXT_EDIT_STYLE)
         layout.addWidget(self.text_edit)
         
         # Buttons
@@ -4041,13 +4086,7 @@ class FleetBulkImportDialog(QDialog):
             '3. Select and copy the ship list (Ctrl+A, Ctrl+C)<br>'
             '4. Paste here and click Import'
         )
-        instructions.setStyleSheet("""
-            color: #e8e8e8;
-            background: #16161d;
-            padding: 15px;
-            border-radius: 2px;
-            border: 1px solid #2a2a35;
-        """)
+        instructions.setStyleSheet(_FLEET_IMPORT_INSTRUCTIONS_STYLE)
         layout.addWidget(instructions)
         
         # Text edit for pasting
@@ -4059,17 +4098,7 @@ class FleetBulkImportDialog(QDialog):
             '• Fleet Summary with ship icons\n'
             '• Ship type followed by number'
         )
-        self.text_edit.setStyleSheet("""
-            QTextEdit {
-                background: #16161d;
-                border: 1px solid #2a2a35;
-                border-radius: 2px;
-                padding: 15px;
-                color: #e8e8e8;
-                font-family: 'Courier New', monospace;
-                font-size: 12px;
-            }
-        """)
+        self.text_edit.setStyleSheet(_DIALOG_TEXT_EDIT_STYLE)
         layout.addWidget(self.text_edit)
         
         # Buttons
@@ -4,11 +4,20 @@ Downloads and parses Static Data Export for routing and mass calculations
 """
 
 import csv
+import functools
+import heapq
 import json
+import math
 import os
 import requests
+import sys
+import threading
+from array import array
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from pathlib import Path
-from security_utils import SecurityValidator, get_rate_limiter
+from security_utils import SecurityValidator, RATE_LIMITER
 
 
 # Drifter Wormhole Mass Limits (for mass calculator)
@@ -28,37 +37,265 @@ WORMHOLE_MASS_LIMITS = {
 }
 
 
+# Per-system record (tuple, not dict - ~8000 of these stay in memory)
+SystemRecord = namedtuple('SystemRecord', 'name region_id security')
+
+
+def _column_indexes(reader, *columns):
+    """Read CSV header row and return the index of each named column"""
+    header = next(reader, None)
+    if not header:
+        raise ValueError("Missing CSV header")
+    return [header.index(column) for column in columns]
+
+
+def _bidirectional_dijkstra(forward, backward, start, end):
+    """
+    Cheapest path via Dijkstra from both ends, stopping once the frontiers meet
+    forward/backward are (offsets, edge_ends, targets, weights) of outgoing and
+    incoming edges. Returns list of nodes or None.
+    """
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    inf = math.inf
+    
+    # Per direction: queue, best known costs, predecessors (successors backward)
+    node_count = len(forward[0]) - 1
+    queues = ([(0.0, start)], [(0.0, end)])
+    dists = ([inf] * node_count, [inf] * node_count)
+    prevs = ([None] * node_count, [None] * node_count)
+    dists[0][start] = 0.0
+    dists[1][end] = 0.0
+    graphs = (forward, backward)
+    
+    best_cost = inf
+    meeting_node = None
+    
+    while queues[0] and queues[1]:
+        # Stop when no route through either frontier can beat the best meeting
+        if queues[0][0][0] + queues[1][0][0] >= best_cost:
+            break
+        
+        # Expand the side with the cheaper frontier
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        pq = queues[side]
+        dist = dists[side]
+        prev = prevs[side]
+        other_dist = dists[1 - side]
+        offsets, edge_ends, targets, weights = graphs[side]
+        
+        cost, node = heappop(pq)
+        
+        # Skip stale queue entries (a cheaper route was found since)
+        if cost > dist[node]:
+            continue
+        
+        for edge in range(offsets[node], edge_ends[node]):
+            next_node = targets[edge]
+            new_cost = cost + weights[edge]
+            if new_cost < dist[next_node]:
+                dist[next_node] = new_cost
+                prev[next_node] = node
+                heappush(pq, (new_cost, next_node))
+            
+            # Route through next_node if the other search has reached it
+            # (inf while unreached, so no separate membership test)
+            total = dist[next_node] + other_dist[next_node]
+            if total < best_cost:
+                best_cost = total
+                meeting_node = next_node
+    
+    if meeting_node is None:
+        return None
+    
+    # Start -> meeting node, then meeting node -> end
+    path = []
+    node = meeting_node
+    while node is not None:
+        path.append(node)
+        node = prevs[0][node]
+    path.reverse()
+    
+    node = prevs[1][meeting_node]
+    while node is not None:
+        path.append(node)
+        node = prevs[1][node]
+    
+    return path
+
+
+def _shortest_path_tree(offsets, edge_ends, targets, weights, start, goals):
+    """
+    Single-source Dijkstra over a CSR graph, stopping once every goal node is settled
+    Returns predecessor list indexed by node (None for start and unreached nodes).
+    """
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    inf = math.inf
+    
+    node_count = len(offsets) - 1
+    pq = [(0.0, start)]
+    dist = [inf] * node_count  # [node] -> best known cost
+    prev = [None] * node_count  # [node] -> predecessor on best path
+    dist[start] = 0.0
+    remaining = set(goals)
+    
+    while pq:
+        cost, node = heappop(pq)
+        
+        # Skip stale queue entries (a cheaper route was found since)
+        if cost > dist[node]:
+            continue
+        
+        remaining.discard(node)
+        if not remaining:
+            break
+        
+        for edge in range(offsets[node], edge_ends[node]):
+            next_node = targets[edge]
+            new_cost = cost + weights[edge]
+            if new_cost < dist[next_node]:
+                dist[next_node] = new_cost
+                prev[next_node] = node
+                heappush(pq, (new_cost, next_node))
+    
+    return prev
+
+
+def _dijkstra(offsets, edge_ends, targets, weights, start, end, max_hops):
+    """
+    Weighted shortest path over a CSR graph of dense node indexes
+    Edges of node i are [offsets[i], edge_ends[i]); paths longer than
+    max_hops systems are not extended. Returns list of nodes or None.
+    """
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    inf = math.inf
+    
+    # Priority queue holds (cost, node); paths are rebuilt from predecessors
+    node_count = len(offsets) - 1
+    pq = [(0.0, start)]
+    dist = [inf] * node_count  # [node] -> best known cost
+    prev = [None] * node_count  # [node] -> predecessor on best path
+    hops = [0] * node_count  # [node] -> systems on best path, including start
+    dist[start] = 0.0
+    hops[start] = 1
+    
+    while pq:
+        cost, node = heappop(pq)
+        
+        # Skip stale queue entries (a cheaper route was found since)
+        if cost > dist[node]:
+            continue
+        
+        # Found destination - walk predecessors back to the start
+        if node == end:
+            path = []
+            while node is not None:
+                path.append(node)
+                node = prev[node]
+            path.reverse()
+            return path
+        
+        next_hops = hops[node] + 1
+        if next_hops > max_hops:
+            continue
+        
+        for edge in range(offsets[node], edge_ends[node]):
+            next_node = targets[edge]
+            new_cost = cost + weights[edge]
+            if new_cost < dist[next_node]:
+                dist[next_node] = new_cost
+                prev[next_node] = node
+                hops[next_node] = next_hops
+                heappush(pq, (new_cost, next_node))
+    
+    return None
+
+
 class EVESDELoader:
     """Load and parse EVE Online Static Data Export (Security Hardened)"""
     
     # Security limits
     MAX_DOWNLOAD_SIZE = 50 * 1024 * 1024  # 50 MB max per file
     DOWNLOAD_TIMEOUT = 60  # seconds
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB reads keep per-chunk overhead low
+    
+    # Parsed data snapshot (JSON - never pickle, the data dir is user-writable)
+    SNAPSHOT_FILE = 'processed_sde.json'
+    SNAPSHOT_VERSION = 1
+    SNAPSHOT_SOURCES = ('systems_processed.csv', 'jumps_processed.csv', 'invTypes.csv', 'invGroups.csv')
+    SPECIAL_SHIPS_FILE = Path(__file__).with_name('special_ships.py')  # Also merged into the snapshot
+    
+    # SHA-256 of each processed CSV as written by process_sde_data
+    PROCESSED_MANIFEST_FILE = 'processed_manifest.json'
+    
+    # Valid ID ranges for processed data (range membership is a cheap bounds test)
+    SYSTEM_ID_RANGE = range(30000000, 33000000 + 1)
+    REGION_ID_RANGE = range(10000000, 11000000 + 1)
+    
+    # Pathfinding edge costs
+    GATE_COST = 1.0
+    JUMPBRIDGE_COST = 0.3  # JBs are MUCH faster
     
     def __init__(self, data_dir='sde_data'):
         # Validate and sanitize data directory
-        self.data_dir = Path(data_dir)
+        data_path = Path(data_dir)
         
-        # Ensure data_dir is safe
-        if '..' in str(data_dir) or '/' in str(data_dir).replace(data_dir, ''):
+        # Ensure data_dir is safe: no parent references, must resolve inside the working directory
+        if '..' in data_path.parts:
             raise ValueError("Invalid data directory path")
         
+        self.data_dir = data_path.resolve()
+        try:
+            self.data_dir.relative_to(Path.cwd().resolve())
+        except ValueError:
+            raise ValueError("Invalid data directory path") from None
+        
         self.data_dir.mkdir(exist_ok=True)
         
         # Data storage
-        self.systems = {}  # {system_id: {name, region_id, security, ...}}
+        self.systems = {}  # {system_id: SystemRecord(name, region_id, security)}
         self.regions = {}  # {region_id: name}
-        self.system_jumps = {}  # {from_system_id: [to_system_id, ...]}
+        self.system_jumps = {}  # {from_system_id: array('i', [to_system_id, ...])}
         self.ship_masses = {}  # {type_name: mass_kg}
-        self.jumpbridges = {}  # {system_id: [connected_system_id, ...]}
+        self.ship_masses_ci = {}  # {type_name.casefold(): type_name}
+        self.ship_name_trie = {}  # {word: {word: ..., None: type_name}} (casefolded words)
+        self.ship_names = []  # Ship type names, alphabetical
+        self._jumpbridges = None  # {system_id: {connected_system_id, ...}}, loaded on first access
         
         # Name lookups for convenience
         self.system_name_to_id = {}
         self.system_id_to_name = {}
         self.region_name_to_id = {}
         
+        # Packed routing graph (CSR), rebuilt on demand after gates/JBs change
+        self._node_index = None  # {system_id: dense_idx}
+        self._node_ids = array('i')  # [dense_idx] -> system_id
+        self._edge_offsets = array('i')  # edges of node i: [offsets[i], offsets[i+1])
+        self._gate_ends = array('i')  # gate edges of node i: [offsets[i], gate_ends[i])
+        self._edge_targets = array('i')  # [edge] -> dense_idx
+        self._edge_weights = array('d')  # [edge] -> cost
+        self._reverse_graph = None  # (offsets, gate_ends, targets, weights) of incoming edges
+        
+        # Per-instance route cache, cleared whenever the routing graph is rebuilt
+        self._cached_path_nodes = functools.lru_cache(maxsize=4096)(self._path_nodes)
+        
         # Rate limiter
-        self.rate_limiter = get_rate_limiter()
+        self.rate_limiter = RATE_LIMITER
+        self._download_lock = threading.Lock()  # Serializes rate limiter updates and download output
+    
+    @property
+    def jumpbridges(self):
+        """Jumpbridge network {system_id: {connected_system_id, ...}}, loaded on first use"""
+        if self._jumpbridges is None:
+            self.load_jumpbridges()
+        return self._jumpbridges
+    
+    @jumpbridges.setter
+    def jumpbridges(self, value):
+        self._jumpbridges = value
+        self._node_index = None  # Routing graph must be repacked
     
     def download_sde_data(self):
         """Download SDE CSV files from Fuzzwork (Security Hardened)"""
@@ -74,6 +311,8 @@ class EVESDELoader:
         
         print("Downloading EVE SDE data...")
         
+        # Validate everything up front, then fetch the missing files in parallel
+        pending = []
         for filename, description in files.items():
             # Sanitize filename
             safe_filename = SecurityValidator.sanitize_filename(filename)
@@ -87,44 +326,68 @@ class EVESDELoader:
                 print(f"✓ {description} already downloaded")
                 continue
             
-            try:
-                url = base_url + safe_filename
-                
-                # Validate URL domain
-                if not SecurityValidator.validate_url_domain(url):
-                    print(f"✗ Invalid or untrusted URL: {url}")
-                    return False
-                
-                # Check rate limit
-                if not self.rate_limiter.can_download(url, cooldown_seconds=3600):
-                    print(f"⚠ Rate limit: Please wait before re-downloading {safe_filename}")
-                    continue
-                
-                print(f"  Downloading {description}...")
-                
-                # Download with security checks
-                if not self._secure_download(url, filepath):
-                    print(f"✗ Failed to download {safe_filename}")
-                    return False
-                
-                # Record successful download
-                self.rate_limiter.record_download(url)
-                print(f"✓ Downloaded {safe_filename}")
+            url = base_url + safe_filename
+            
+            # Validate URL domain
+            if not SecurityValidator.validate_url_domain(url):
+                print(f"✗ Invalid or untrusted URL: {url}")
+                return False
+            
+            # Check rate limit
+            if not self.rate_limiter.can_download(url, cooldown_seconds=3600):
+                print(f"⚠ Rate limit: Please wait before re-downloading {safe_filename}")
+                continue
+            
+            pending.append((url, filepath, safe_filename, description))
+        
+        if pending:
+            # One pooled session so connections are reused across files
+            with requests.Session() as session:
+                adapter = HTTPAdapter(pool_connections=len(pending), pool_maxsize=len(pending))
+                session.mount('https://', adapter)
                 
-            except Exception as e:
-                print(f"✗ Failed to download {safe_filename}: {e}")
+                with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                    results = list(executor.map(
+                        lambda job: self._download_file(session, *job), pending))
+            
+            if not all(results):
                 return False
         
         print("✓ All SDE data downloaded")
         return True
     
-    def _secure_download(self, url: str, filepath: Path) -> bool:
+    def _download_file(self, session, url: str, filepath: Path, safe_filename: str, description: str) -> bool:
+        """Download one SDE file (runs on a download worker thread)"""
+        try:
+            self._log(f"  Downloading {description}...")
+            
+            # Download with security checks
+            if not self._secure_download(url, filepath, session):
+                self._log(f"✗ Failed to download {safe_filename}")
+                return False
+            
+            # Record successful download
+            with self._download_lock:
+                self.rate_limiter.record_download(url)
+            self._log(f"✓ Downloaded {safe_filename}")
+            return True
+            
+        except Exception as e:
+            self._log(f"✗ Failed to download {safe_filename}: {e}")
+            return False
+    
+    def _log(self, message: str):
+        """Print without interleaving output from download threads"""
+        with self._download_lock:
+            print(message)
+    
+    def _secure_download(self, url: str, filepath: Path, session=None) -> bool:
         """
         Securely download file with size limits and HTTPS enforcement
         """
         try:
             # HTTPS-only with certificate verification
-            response = requests.get(
+            response = (session or requests).get(
                 url,
                 timeout=self.DOWNLOAD_TIMEOUT,
                 verify=True,  # Enforce SSL certificate validation
@@ -132,50 +395,67 @@ class EVESDELoader:
             )
             response.raise_for_status()
             
-            # Check content length
+            # Check content length (compressed size when the server gzips -
+            # requests asks for gzip by default; the decoded size is enforced
+            # while streaming below)
             content_length = response.headers.get('Content-Length')
             if content_length:
                 size = int(content_length)
                 if size > self.MAX_DOWNLOAD_SIZE:
-                    print(f"  ✗ File too large: {size / 1024 / 1024:.1f} MB (max: {self.MAX_DOWNLOAD_SIZE / 1024 / 1024:.1f} MB)")
+                    self._log(f"  ✗ File too large: {size / 1024 / 1024:.1f} MB (max: {self.MAX_DOWNLOAD_SIZE / 1024 / 1024:.1f} MB)")
                     return False
             
             # Download with size checking
+            # (unbuffered fd - chunks are already 1 MiB, a file buffer only adds a copy)
             downloaded = 0
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+            fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+            try:
+                for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
                     if chunk:
                         downloaded += len(chunk)
                         
                         # Enforce max size during download
                         if downloaded > self.MAX_DOWNLOAD_SIZE:
-                            print(f"  ✗ Download exceeded size limit")
+                            self._log(f"  ✗ Download exceeded size limit")
+                            os.close(fd)
+                            fd = None
                             filepath.unlink(missing_ok=True)
                             return False
                         
-                        f.write(chunk)
+                        # os.write may write less than asked - loop until the chunk is out
+                        view = memoryview(chunk)
+                        while view:
+                            view = view[os.write(fd, view):]
+            finally:
+                if fd is not None:
+                    os.close(fd)
             
             # Display download size
             size_mb = downloaded / 1024 / 1024
-            print(f"  Downloaded {size_mb:.1f} MB")
+            self._log(f"  Downloaded {size_mb:.1f} MB")
             
             return True
             
         except requests.exceptions.SSLError as e:
-            print(f"  ✗ SSL certificate validation failed: {e}")
+            self._log(f"  ✗ SSL certificate validation failed: {e}")
             return False
         except requests.exceptions.Timeout:
-            print(f"  ✗ Download timeout")
+            self._log(f"  ✗ Download timeout")
             return False
         except requests.exceptions.RequestException as e:
-            print(f"  ✗ Download error: {e}")
+            self._log(f"  ✗ Download error: {e}")
             return False
         except Exception as e:
-            print(f"  ✗ Unexpected error: {e}")
+            self._log(f"  ✗ Unexpected error: {e}")
             return False
     
     def load_processed_data(self):
         """Load preprocessed data if available"""
+        # Fast path: snapshot of previously validated data
+        # (jumpbridges load on first use)
+        if self._load_snapshot():
+            return len(self.systems) > 0
+        
         processed_files = {
             'systems_processed.csv': self._load_systems_processed,
             'jumps_processed.csv': self._load_jumps_processed,
@@ -209,91 +489,247 @@ class EVESDELoader:
             print("⚠ Ship mass data not available. Mass calculator will be limited.")
             print("   Ship data is loaded during SDE processing.")
         
-        # Load jumpbridge network (optional)
-        self.load_jumpbridges()
+        # Save validated data so the next startup skips CSV parsing
+        # (jumpbridges load on first use)
+        if self.systems:
+            self._save_snapshot()
         
         return len(self.systems) > 0
     
+    def _load_snapshot(self) -> bool:
+        """Load parsed SDE snapshot if it is newer than all of its source files"""
+        snapshot_file = self.data_dir / self.SNAPSHOT_FILE
+        if not snapshot_file.exists():
+            return False
+        
+        safe_path = SecurityValidator.sanitize_path(snapshot_file, self.data_dir)
+        if not safe_path:
+            return False
+        
+        try:
+            snapshot_mtime = safe_path.stat().st_mtime
+            
+            # Processed CSVs must exist; any source newer than the snapshot makes it stale
+            for filename in self.SNAPSHOT_SOURCES:
+                source = self.data_dir / filename
+                if not source.exists():
+                    if filename.endswith('_processed.csv'):
+                        return False
+                    continue
+                if source.stat().st_mtime >= snapshot_mtime:
+                    return False
+            
+            # Special edition ships are merged into the snapshot's ship masses,
+            # so edits to special_ships.py make it stale as well
+            if self.SPECIAL_SHIPS_FILE.exists() and self.SPECIAL_SHIPS_FILE.stat().st_mtime >= snapshot_mtime:
+                return False
+            
+            with open(safe_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            if data.get('version') != self.SNAPSHOT_VERSION:
+                return False
+            
+            # JSON object keys are strings - convert back while checking types
+            systems = {
+                int(system_id): SystemRecord(sys.intern(str(name)), int(region_id), float(security))
+                for system_id, (name, region_id, security) in data['systems'].items()
+            }
+            system_jumps = {
+                int(from_system): array('i', [int(to_system) for to_system in to_systems])
+                for from_system, to_systems in data['system_jumps'].items()
+            }
+            # Masses keep their JSON type (int for special edition ships), as
+            # _snapshot_is_valid rejects anything that is not a plain number
+            ship_masses = {sys.intern(str(name)): mass for name, mass in data['ship_masses'].items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError, OverflowError):
+            # Unreadable or stale snapshot - fall back to the CSVs
+            return False
+        
+        # The data dir is user-writable: anything the CSV loaders would have
+        # rejected means the snapshot was not written by us
+        if not self._snapshot_is_valid(systems, system_jumps, ship_masses):
+            return False
+        
+        self.systems = systems
+        self.system_jumps = system_jumps
+        self.ship_masses = ship_masses
+        self.system_name_to_id = {system.name: system_id for system_id, system in systems.items()}
+        self.system_id_to_name = {system_id: system.name for system_id, system in systems.items()}
+        self._index_ship_masses()
+        
+        return True
+    
+    def _snapshot_is_valid(self, systems, system_jumps, ship_masses) -> bool:
+        """Check snapshot contents against the same rules the CSV loaders apply"""
+        system_ids = self.SYSTEM_ID_RANGE
+        region_ids = self.REGION_ID_RANGE
+        validate_name = SecurityValidator.validate_system_name
+        
+        for system_id, system in systems.items():
+            if system_id not in system_ids or system.region_id not in region_ids:
+                return False
+            if not -1.0 <= system.security <= 1.0:
+                return False
+            if validate_name(system.name) != system.name:
+                return False
+        
+        for from_system, to_systems in system_jumps.items():
+            if from_system not in system_ids:
+                return False
+            for to_system in to_systems:
+                if to_system not in system_ids:
+                    return False
+        
+        for type_name, mass in ship_masses.items():
+            if not type_name or type_name != type_name.strip() or len(type_name) > 100:
+                return False
+            if isinstance(mass, bool) or not isinstance(mass, (int, float)):
+                return False
+            # Subcapital ships only, as in _load_ship_masses
+            if not 0 < mass < 1_000_000_000:
+                return False
+        
+        return True
+    
+    def _save_snapshot(self):
+        """Write parsed SDE data to the snapshot file"""
+        snapshot_file = self.data_dir / self.SNAPSHOT_FILE
+        safe_path = SecurityValidator.sanitize_path(snapshot_file, self.data_dir)
+        if not safe_path:
+            return
+        
+        data = {
+            'version': self.SNAPSHOT_VERSION,
+            'systems': {
+                system_id: list(system)
+                for system_id, system in self.systems.items()
+            },
+            'system_jumps': {
+                from_system: to_systems.tolist()
+                for from_system, to_systems in self.system_jumps.items()
+            },
+            'ship_masses': self.ship_masses,
+        }
+        
+        # Write to a temp file and swap in, so a crash never leaves a truncated snapshot
+        temp_path = safe_path.with_suffix('.tmp')
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(temp_path, safe_path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"⚠ Failed to save SDE snapshot: {e}")
+            temp_path.unlink(missing_ok=True)
+    
+    def _read_processed_manifest(self) -> dict:
+        """Read {filename: sha256} manifest of processed CSVs (empty if missing/invalid)"""
+        manifest_file = self.data_dir / self.PROCESSED_MANIFEST_FILE
+        safe_path = SecurityValidator.sanitize_path(manifest_file, self.data_dir)
+        if not safe_path or not safe_path.exists():
+            return {}
+        
+        try:
+            with open(safe_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if not isinstance(manifest, dict):
+            return {}
+        return {str(name): str(digest) for name, digest in manifest.items()}
+    
+    def _record_processed_hash(self, filepath: Path):
+        """Store hash of a freshly written processed CSV in the manifest"""
+        digest = SecurityValidator.calculate_file_hash(filepath)
+        manifest = self._read_processed_manifest()
+        if digest:
+            manifest[filepath.name] = digest
+        else:
+            manifest.pop(filepath.name, None)
+        
+        try:
+            with open(self.data_dir / self.PROCESSED_MANIFEST_FILE, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2)
+        except OSError as e:
+            print(f"⚠ Failed to save processed data manifest: {e}")
+    
+    def _is_trusted_processed(self, filepath: Path) -> bool:
+        """True if a processed CSV is byte-for-byte what process_sde_data wrote"""
+        expected_hash = self._read_processed_manifest().get(filepath.name)
+        if not expected_hash:
+            return False
+        return SecurityValidator.verify_file_hash(filepath, expected_hash)
+    
     def _load_systems_processed(self, filepath):
         """Load processed systems data with validation"""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+        with open(filepath, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            id_col, name_col, region_col, security_col = _column_indexes(
+                reader, 'system_id', 'system_name', 'region_id', 'security'
+            )
+            
+            system_ids = self.SYSTEM_ID_RANGE
+            region_ids = self.REGION_ID_RANGE
+            trusted = self._is_trusted_processed(filepath)
             
             for row in reader:
                 try:
                     # Validate and sanitize system_id
-                    system_id = SecurityValidator.validate_integer(
-                        row['system_id'],
-                        min_val=30000000,
-                        max_val=33000000
-                    )
-                    if not system_id:
+                    system_id = int(row[id_col])
+                    if system_id not in system_ids:
                         continue
                     
-                    # Validate system name
-                    system_name = SecurityValidator.validate_system_name(row['system_name'])
+                    # Validate system name (already validated on write if the file is ours)
+                    system_name = row[name_col] if trusted else SecurityValidator.validate_system_name(row[name_col])
                     if not system_name:
                         continue
+                    system_name = sys.intern(system_name)
                     
                     # Validate region_id
-                    region_id = SecurityValidator.validate_integer(
-                        row['region_id'],
-                        min_val=10000000,
-                        max_val=11000000
-                    )
-                    if not region_id:
+                    region_id = int(row[region_col])
+                    if region_id not in region_ids:
                         continue
                     
                     # Validate security (can be negative)
-                    security = SecurityValidator.validate_float(
-                        row['security'],
-                        min_val=-1.0,
-                        max_val=1.0
-                    )
-                    if security is None:
+                    try:
+                        security = float(row[security_col])
+                    except ValueError:
+                        security = 0.0
+                    if security < -1.0 or security > 1.0:
                         security = 0.0
                     
-                    self.systems[system_id] = {
-                        'name': system_name,
-                        'region_id': region_id,
-                        'security': security
-                    }
+                    self.systems[system_id] = SystemRecord(system_name, region_id, security)
                     
                     self.system_name_to_id[system_name] = system_id
                     self.system_id_to_name[system_id] = system_name
                     
-                except (KeyError, ValueError) as e:
+                except (IndexError, ValueError):
                     # Skip malformed rows
                     continue
     
     def _load_jumps_processed(self, filepath):
         """Load processed jumps data with validation"""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+        with open(filepath, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            from_col, to_col = _column_indexes(reader, 'from_system', 'to_system')
+            system_ids = self.SYSTEM_ID_RANGE
             
             for row in reader:
                 try:
                     # Validate system IDs
-                    from_system = SecurityValidator.validate_integer(
-                        row['from_system'],
-                        min_val=30000000,
-                        max_val=33000000
-                    )
-                    to_system = SecurityValidator.validate_integer(
-                        row['to_system'],
-                        min_val=30000000,
-                        max_val=33000000
-                    )
+                    from_system = int(row[from_col])
+                    to_system = int(row[to_col])
                     
-                    if not from_system or not to_system:
+                    if from_system not in system_ids or to_system not in system_ids:
                         continue
                     
                     if from_system not in self.system_jumps:
-                        self.system_jumps[from_system] = []
+                        self.system_jumps[from_system] = array('i')
                     
                     self.system_jumps[from_system].append(to_system)
                     
-                except (KeyError, ValueError):
+                except (IndexError, ValueError):
                     continue
     
     def _load_ship_masses(self):
@@ -314,17 +750,18 @@ class EVESDELoader:
         # Load ship group IDs
         ship_groups = set()
         try:
-            with open(safe_groups, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+            with open(safe_groups, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                group_col, category_col = _column_indexes(reader, 'groupID', 'categoryID')
                 for row in reader:
                     try:
                         # Category 6 = Ships
-                        category_id = SecurityValidator.validate_integer(row.get('categoryID'))
-                        group_id = SecurityValidator.validate_integer(row.get('groupID'))
+                        category_id = SecurityValidator.validate_integer(row[category_col])
+                        group_id = SecurityValidator.validate_integer(row[group_col])
                         
                         if category_id == 6 and group_id:
                             ship_groups.add(group_id)
-                    except (KeyError, ValueError):
+                    except (IndexError, ValueError):
                         continue
         except Exception as e:
             print(f"⚠ Failed to load ship groups: {e}")
@@ -332,19 +769,28 @@ class EVESDELoader:
         
         # Load ship types and masses
         try:
-            with open(safe_types, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+            with open(safe_types, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                group_col, name_col, mass_col = _column_indexes(reader, 'groupID', 'typeName', 'mass')
+                
+                # Most rows aren't ships - decide each distinct groupID string once
+                # and skip everything else before any field parsing
+                is_ship_group = {}  # {raw groupID: bool}
                 
                 for row in reader:
                     try:
-                        group_id = SecurityValidator.validate_integer(row.get('groupID'))
+                        raw_group = row[group_col]
+                        is_ship = is_ship_group.get(raw_group)
+                        if is_ship is None:
+                            group_id = SecurityValidator.validate_integer(raw_group)
+                            is_ship = is_ship_group[raw_group] = group_id in ship_groups
                         
-                        if group_id not in ship_groups:
+                        if not is_ship:
                             continue
                         
                         # Validate mass (must be positive)
                         mass = SecurityValidator.validate_float(
-                            row.get('mass', '0'),
+                            row[mass_col],
                             min_val=0,
                             max_val=10_000_000_000  # 10 billion kg max
                         )
@@ -357,13 +803,13 @@ class EVESDELoader:
                             continue
                         
                         # Validate type name
-                        type_name = row.get('typeName', '').strip()
+                        type_name = row[name_col].strip()
                         if not type_name or len(type_name) > 100:
                             continue
                         
-                        self.ship_masses[type_name] = mass
+                        self.ship_masses[sys.intern(type_name)] = mass
                         
-                    except (KeyError, ValueError):
+                    except (IndexError, ValueError):
                         continue
         except Exception as e:
             print(f"⚠ Failed to load ship masses: {e}")
@@ -381,45 +827,107 @@ class EVESDELoader:
             # special_ships.py not available - that's okay
             pass
         
+        self._index_ship_masses()
+        
         return len(self.ship_masses) > 0
     
+    def _index_ship_masses(self):
+        """Build lookup indexes: case-insensitive names, word trie, sorted names"""
+        self.ship_masses_ci = {name.casefold(): name for name in self.ship_masses}
+        self._build_ship_name_trie()
+        
+        self.ship_names = sorted(self.ship_masses)
+    
+    def get_ship_name(self, ship_name: str):
+        """
+        Resolve a ship name case-insensitively to its canonical SDE spelling
+        Returns None if the ship is unknown
+        """
+        if ship_name in self.ship_masses:
+            return ship_name
+        
+        return self.ship_masses_ci.get(ship_name.casefold())
+    
+    def _build_ship_name_trie(self):
+        """Build word-level trie of ship names for free-text matching"""
+        trie = {}
+        for name in self.ship_masses:
+            node = trie
+            for word in name.casefold().split():
+                node = node.setdefault(word, {})
+            node[None] = name
+        self.ship_name_trie = trie
+    
+    def find_ship_in_text(self, text: str):
+        """
+        Find a known ship name embedded in free text (e.g. a fleet window line)
+        Returns the canonical name of the last, longest match, or None
+        """
+        words = text.casefold().split()
+        trie = self.ship_name_trie
+        found = None
+        
+        # Walk the trie from each word; a walk stops as soon as no ship name continues
+        for start in range(len(words)):
+            node = trie
+            match = None
+            for word in words[start:]:
+                node = node.get(word)
+                if node is None:
+                    break
+                match = node.get(None, match)
+            if match:
+                found = match
+        
+        return found
+    
     def load_jumpbridges(self):
         """Load jumpbridge network and integrate into routing"""
+        # Routing graph must be repacked with the new connections
+        self._node_index = None
+        if self._jumpbridges is None:
+            self._jumpbridges = {}
+        
         try:
             from jumpbridges import JUMPBRIDGES, JB_GATE_COMPARISON
             
             jb_count = 0
             skipped = 0
+            missing_systems = set()
             for system1, system2, alliance in JUMPBRIDGES:
                 # Get system IDs
                 sys1_id = self.system_name_to_id.get(system1)
                 sys2_id = self.system_name_to_id.get(system2)
                 
                 if not sys1_id or not sys2_id:
-                    # System not in database - might be invalid name
+                    # System not in database - might be invalid name (reported once below)
                     skipped += 1
-                    if skipped <= 3:  # Show first few for debugging
-                        if not sys1_id:
-                            print(f"  ⚠ JB system not found: {system1}")
-                        if not sys2_id:
-                            print(f"  ⚠ JB system not found: {system2}")
+                    if not sys1_id:
+                        missing_systems.add(system1)
+                    if not sys2_id:
+                        missing_systems.add(system2)
                     continue
                 
                 # Add bidirectional jumpbridge connections
                 # JBs are added to jumpbridges dict separately from gates
-                if sys1_id not in self.jumpbridges:
-                    self.jumpbridges[sys1_id] = []
-                if sys2_id not in self.jumpbridges:
-                    self.jumpbridges[sys2_id] = []
+                # (sets, so duplicate bridges collapse)
+                if sys1_id not in self._jumpbridges:
+                    self._jumpbridges[sys1_id] = set()
+                if sys2_id not in self._jumpbridges:
+                    self._jumpbridges[sys2_id] = set()
                 
                 # Bidirectional
-                if sys2_id not in self.jumpbridges[sys1_id]:
-                    self.jumpbridges[sys1_id].append(sys2_id)
-                if sys1_id not in self.jumpbridges[sys2_id]:
-                    self.jumpbridges[sys2_id].append(sys1_id)
+                self._jumpbridges[sys1_id].add(sys2_id)
+                self._jumpbridges[sys2_id].add(sys1_id)
                 
                 jb_count += 1
             
+            if missing_systems:
+                # Show first few for debugging
+                shown = ', '.join(sorted(missing_systems)[:5])
+                more = f" (+{len(missing_systems) - 5} more)" if len(missing_systems) > 5 else ""
+                print(f"  ⚠ {len(missing_systems)} JB systems not found: {shown}{more}")
+            
             if jb_count > 0:
                 print(f"✓ Loaded {jb_count} jumpbridge connections")
                 if skipped > 0:
@@ -477,17 +985,19 @@ class EVESDELoader:
         
         # Load regions first
         try:
-            with open(safe_regions, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+            with open(safe_regions, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                id_col, name_col = _column_indexes(reader, 'regionID', 'regionName')
                 for row in reader:
                     try:
-                        region_id = SecurityValidator.validate_integer(row.get('regionID'))
-                        region_name = SecurityValidator.validate_region_name(row.get('regionName', ''))
+                        region_id = SecurityValidator.validate_integer(row[id_col])
+                        region_name = SecurityValidator.validate_region_name(row[name_col])
                         
                         if region_id and region_name:
+                            region_name = sys.intern(region_name)
                             self.regions[region_id] = region_name
                             self.region_name_to_id[region_name] = region_id
-                    except (KeyError, ValueError):
+                    except (IndexError, ValueError):
                         continue
         except Exception as e:
             print(f"✗ Failed to process regions: {e}")
@@ -495,40 +1005,47 @@ class EVESDELoader:
         
         # Load systems
         try:
-            with open(safe_systems, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+            with open(safe_systems, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                id_col, region_col, name_col, security_col = _column_indexes(
+                    reader, 'solarSystemID', 'regionID', 'solarSystemName', 'security'
+                )
                 
-                output_file = self.data_dir / 'systems_processed.csv'
-                with open(output_file, 'w', newline='', encoding='utf-8') as out_f:
-                    writer = csv.writer(out_f)
-                    writer.writerow(['system_id', 'system_name', 'region_id', 'security'])
-                    
-                    for row in reader:
-                        try:
-                            system_id = SecurityValidator.validate_integer(row.get('solarSystemID'))
-                            region_id = SecurityValidator.validate_integer(row.get('regionID'))
-                            system_name = SecurityValidator.validate_system_name(row.get('solarSystemName', ''))
-                            security = SecurityValidator.validate_float(row.get('security', '0'))
-                            
-                            if not system_id or not region_id or not system_name:
-                                continue
-                            
-                            if security is None:
-                                security = 0.0
-                            
-                            self.systems[system_id] = {
-                                'name': system_name,
-                                'region_id': region_id,
-                                'security': security
-                            }
-                            
-                            self.system_name_to_id[system_name] = system_id
-                            self.system_id_to_name[system_id] = system_name
-                            
-                            writer.writerow([system_id, system_name, region_id, security])
-                            
-                        except (KeyError, ValueError):
+                rows = []  # Written in one batch after parsing
+                for row in reader:
+                    try:
+                        system_id = SecurityValidator.validate_integer(row[id_col])
+                        region_id = SecurityValidator.validate_integer(row[region_col])
+                        system_name = SecurityValidator.validate_system_name(row[name_col])
+                        security = SecurityValidator.validate_float(row[security_col])
+                        
+                        if not system_id or not region_id or not system_name:
+                            continue
+                        
+                        # Same ID range the processed loader accepts (IDs are packed as 32-bit ints)
+                        if system_id not in self.SYSTEM_ID_RANGE:
                             continue
+                        
+                        if security is None:
+                            security = 0.0
+                        
+                        system_name = sys.intern(system_name)
+                        self.systems[system_id] = SystemRecord(system_name, region_id, security)
+                        
+                        self.system_name_to_id[system_name] = system_id
+                        self.system_id_to_name[system_id] = system_name
+                        
+                        rows.append((system_id, system_name, region_id, security))
+                        
+                    except (IndexError, ValueError):
+                        continue
+            
+            output_file = self.data_dir / 'systems_processed.csv'
+            with open(output_file, 'w', newline='', encoding='utf-8') as out_f:
+                writer = csv.writer(out_f)
+                writer.writerow(['system_id', 'system_name', 'region_id', 'security'])
+                writer.writerows(rows)
+            self._record_processed_hash(output_file)
         except Exception as e:
             print(f"✗ Failed to process systems: {e}")
             return False
@@ -550,31 +1067,38 @@ class EVESDELoader:
             return False
         
         try:
-            with open(safe_jumps, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+            with open(safe_jumps, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                from_col, to_col = _column_indexes(reader, 'fromSolarSystemID', 'toSolarSystemID')
                 
-                output_file = self.data_dir / 'jumps_processed.csv'
-                with open(output_file, 'w', newline='', encoding='utf-8') as out_f:
-                    writer = csv.writer(out_f)
-                    writer.writerow(['from_system', 'to_system'])
-                    
-                    for row in reader:
-                        try:
-                            from_system = SecurityValidator.validate_integer(row.get('fromSolarSystemID'))
-                            to_system = SecurityValidator.validate_integer(row.get('toSolarSystemID'))
-                            
-                            if not from_system or not to_system:
-                                continue
-                            
-                            if from_system not in self.system_jumps:
-                                self.system_jumps[from_system] = []
-                            
-                            self.system_jumps[from_system].append(to_system)
-                            
-                            writer.writerow([from_system, to_system])
-                            
-                        except (KeyError, ValueError):
+                rows = []  # Written in one batch after parsing
+                for row in reader:
+                    try:
+                        from_system = SecurityValidator.validate_integer(row[from_col])
+                        to_system = SecurityValidator.validate_integer(row[to_col])
+                        
+                        if not from_system or not to_system:
+                            continue
+                        
+                        # Same ID range the processed loader accepts (IDs are packed as 32-bit ints)
+                        if from_system not in self.SYSTEM_ID_RANGE or to_system not in self.SYSTEM_ID_RANGE:
                             continue
+                        
+                        if from_system not in self.system_jumps:
+                            self.system_jumps[from_system] = array('i')
+                        
+                        self.system_jumps[from_system].append(to_system)
+                        
+                        rows.append((from_system, to_system))
+                        
+                    except (IndexError, ValueError):
+                        continue
+            
+            output_file = self.data_dir / 'jumps_processed.csv'
+            with open(output_file, 'w', newline='', encoding='utf-8') as out_f:
+                writer = csv.writer(out_f)
+                writer.writerow(['from_system', 'to_system'])
+                writer.writerows(rows)
         except Exception as e:
             print(f"✗ Failed to process jumps: {e}")
             return False
@@ -596,8 +1120,59 @@ class EVESDELoader:
         if not system_data:
             return "Unknown"
         
-        region_id = system_data.get('region_id')
-        return self.regions.get(region_id, "Unknown")
+        return self.regions.get(system_data.region_id, "Unknown")
+    
+    def _build_routing_graph(self):
+        """Pack gate and jumpbridge connections into flat CSR arrays for pathfinding"""
+        self._cached_path_nodes.cache_clear()
+        jumpbridges = self.jumpbridges  # Lazy load first - loading resets the graph
+        
+        node_ids = set(self.systems)
+        for from_system, to_systems in self.system_jumps.items():
+            node_ids.add(from_system)
+            node_ids.update(to_systems)
+        node_ids.update(jumpbridges)  # JBs are bidirectional, keys cover all endpoints
+        
+        # Dense indexes follow system ID order so queue ties break the same way
+        self._node_ids = array('i', sorted(node_ids))
+        self._node_index = node_index = {sid: i for i, sid in enumerate(self._node_ids)}
+        
+        gate_lists = [[node_index[to_system] for to_system in self.system_jumps.get(system_id, ())]
+                      for system_id in self._node_ids]
+        jb_lists = [[node_index[to_system] for to_system in jumpbridges.get(system_id, ())]
+                    for system_id in self._node_ids]
+        
+        (self._edge_offsets, self._gate_ends,
+         self._edge_targets, self._edge_weights) = self._pack_adjacency(gate_lists, jb_lists)
+        
+        # Incoming edges for the backward half of bidirectional search
+        reverse_gates = [[] for _ in gate_lists]
+        reverse_jbs = [[] for _ in jb_lists]
+        for node, to_nodes in enumerate(gate_lists):
+            for to_node in to_nodes:
+                reverse_gates[to_node].append(node)
+        for node, to_nodes in enumerate(jb_lists):
+            for to_node in to_nodes:
+                reverse_jbs[to_node].append(node)
+        self._reverse_graph = self._pack_adjacency(reverse_gates, reverse_jbs)
+    
+    def _pack_adjacency(self, gate_lists, jb_lists):
+        """Pack per-node gate/JB neighbor lists into (offsets, gate_ends, targets, weights)"""
+        # Per node: gate edges first, then jumpbridge edges
+        offsets = array('i', [0])
+        gate_ends = array('i')
+        targets = array('i')
+        weights = array('d')
+        for gates, jbs in zip(gate_lists, jb_lists):
+            targets.extend(gates)
+            weights.extend([self.GATE_COST] * len(gates))
+            gate_ends.append(len(targets))
+            
+            targets.extend(jbs)
+            weights.extend([self.JUMPBRIDGE_COST] * len(jbs))
+            offsets.append(len(targets))
+        
+        return offsets, gate_ends, targets, weights
     
     def find_path(self, start_system: str, end_system: str, max_jumps: int = 30, use_jumpbridges: bool = True):
         """
@@ -616,59 +1191,151 @@ class EVESDELoader:
             - Standard gate: 1.0
             - Jumpbridge: 0.3 (much faster, instant travel)
         """
-        import heapq
-        
-        # Validate inputs
+        # Validate inputs (stop at the first bad one)
         start_system = SecurityValidator.validate_system_name(start_system)
+        if not start_system:
+            return None
+        
         end_system = SecurityValidator.validate_system_name(end_system)
-        max_jumps = SecurityValidator.validate_integer(str(max_jumps), min_val=1, max_val=100)
+        if not end_system:
+            return None
         
-        if not start_system or not end_system or not max_jumps:
+        max_jumps = SecurityValidator.validate_integer(str(max_jumps), min_val=1, max_val=100)
+        if not max_jumps:
             return None
         
         start_id = self.system_name_to_id.get(start_system)
-        end_id = self.system_name_to_id.get(end_system)
+        if not start_id:
+            return None
         
-        if not start_id or not end_id:
+        end_id = self.system_name_to_id.get(end_system)
+        if not end_id:
             return None
         
         if start_id == end_id:
             return [start_system]
         
-        # Dijkstra's algorithm with weighted edges
-        # Priority queue: (cost, current_id, path)
-        pq = [(0, start_id, [start_id])]
-        visited = {}  # {system_id: min_cost}
+        if self._node_index is None:
+            self._build_routing_graph()
         
-        while pq:
-            cost, current_id, path = heapq.heappop(pq)
-            
-            # Skip if we've seen this system with lower cost
-            if current_id in visited and visited[current_id] <= cost:
+        start_idx = self._node_index.get(start_id)
+        end_idx = self._node_index.get(end_id)
+        if start_idx is None or end_idx is None:
+            return None
+        
+        path = self._cached_path_nodes(start_idx, end_idx, max_jumps, bool(use_jumpbridges))
+        if path is None:
+            return None
+        
+        node_ids = self._node_ids
+        return [self.system_id_to_name[node_ids[node]] for node in path]
+    
+    def _path_nodes(self, start_idx: int, end_idx: int, max_jumps: int, use_jumpbridges: bool):
+        """Route between dense node indexes as a tuple (cacheable), or None"""
+        # Gate edges sit before JB edges, so stopping at gate_ends skips jumpbridges
+        offsets = self._edge_offsets
+        edge_ends = offsets[1:] if use_jumpbridges else self._gate_ends
+        reverse_offsets, reverse_gate_ends, reverse_targets, reverse_weights = self._reverse_graph
+        reverse_ends = reverse_offsets[1:] if use_jumpbridges else reverse_gate_ends
+        max_hops = max_jumps * 2 + 1  # Allow more steps for JB routes
+        
+        # Meet-in-the-middle search finds the cheapest route; only if it is longer than
+        # the jump limit fall back to the hop-limited single-source search
+        path = _bidirectional_dijkstra(
+            (offsets, edge_ends, self._edge_targets, self._edge_weights),
+            (reverse_offsets, reverse_ends, reverse_targets, reverse_weights),
+            start_idx, end_idx)
+        if path is None:
+            return None
+        
+        if len(path) > max_hops:
+            path = _dijkstra(offsets, edge_ends, self._edge_targets, self._edge_weights,
+                             start_idx, end_idx, max_hops)
+            if path is None:
+                return None
+        
+        return tuple(path)
+    
+    def find_paths(self, start_system: str, end_systems, max_jumps: int = 30,
+                   use_jumpbridges: bool = True, reverse: bool = False):
+        """
+        Find shortest paths from one system to many with a single search
+        
+        Args:
+            start_system: Shared endpoint of every route
+            end_systems: Iterable of system names
+            max_jumps: Maximum gate jumps allowed per route
+            use_jumpbridges: Whether to include jumpbridge network
+            reverse: Route from each end system TO start_system instead
+        
+        Returns:
+            Dict {end_system: list of system names (travel order) or None}
+        """
+        end_systems = list(end_systems)
+        paths = dict.fromkeys(end_systems)
+        
+        # Validate inputs
+        start_system = SecurityValidator.validate_system_name(start_system)
+        max_jumps = SecurityValidator.validate_integer(str(max_jumps), min_val=1, max_val=100)
+        
+        if not start_system or not max_jumps:
+            return paths
+        
+        start_id = self.system_name_to_id.get(start_system)
+        if not start_id:
+            return paths
+        
+        if self._node_index is None:
+            self._build_routing_graph()
+        
+        start_idx = self._node_index.get(start_id)
+        if start_idx is None:
+            return paths
+        
+        # {end_system: dense_idx} for valid, known systems
+        goals = {}
+        for end_system in end_systems:
+            safe_name = SecurityValidator.validate_system_name(end_system)
+            end_id = self.system_name_to_id.get(safe_name) if safe_name else None
+            end_idx = self._node_index.get(end_id) if end_id else None
+            if end_idx is not None:
+                goals[end_system] = end_idx
+        
+        if not goals:
+            return paths
+        
+        # Backward routes search incoming edges, so predecessors point toward start
+        if reverse:
+            offsets, gate_ends, targets, weights = self._reverse_graph
+        else:
+            offsets, gate_ends, targets, weights = (
+                self._edge_offsets, self._gate_ends, self._edge_targets, self._edge_weights)
+        edge_ends = offsets[1:] if use_jumpbridges else gate_ends
+        max_hops = max_jumps * 2 + 1  # Allow more steps for JB routes
+        
+        prev = _shortest_path_tree(offsets, edge_ends, targets, weights, start_idx, set(goals.values()))
+        
+        node_ids = self._node_ids
+        for end_system, end_idx in goals.items():
+            if prev[end_idx] is None and end_idx != start_idx:
                 continue
             
-            visited[current_id] = cost
+            path = []
+            node = end_idx
+            while node is not None:
+                path.append(self.system_id_to_name.get(node_ids[node]))
+                node = prev[node]
+            if not reverse:
+                path.reverse()
             
-            # Found destination
-            if current_id == end_id:
-                return [self.system_id_to_name[sid] for sid in path]
+            # Cheapest route exceeds the jump limit (or crosses an unnamed system)
+            # - use the hop-limited search
+            if len(path) > max_hops or None in path:
+                if reverse:
+                    path = self.find_path(end_system, start_system, max_jumps, use_jumpbridges)
+                else:
+                    path = self.find_path(start_system, end_system, max_jumps, use_jumpbridges)
             
-            # Exceeded max jumps (approximate - jumpbridges count as 0.3)
-            if len(path) > max_jumps * 2:  # Allow more steps for JB routes
-                continue
-            
-            # Explore standard gate connections (cost: 1.0)
-            if current_id in self.system_jumps:
-                for next_id in self.system_jumps[current_id]:
-                    new_cost = cost + 1.0
-                    if next_id not in visited or visited.get(next_id, float('inf')) > new_cost:
-                        heapq.heappush(pq, (new_cost, next_id, path + [next_id]))
-            
-            # Explore jumpbridge connections (cost: 0.3)
-            if use_jumpbridges and current_id in self.jumpbridges:
-                for next_id in self.jumpbridges[current_id]:
-                    new_cost = cost + 0.3  # JBs are MUCH faster
-                    if next_id not in visited or visited.get(next_id, float('inf')) > new_cost:
-                        heapq.heappush(pq, (new_cost, next_id, path + [next_id]))
+            paths[end_system] = path
         
-        return None
+        return paths
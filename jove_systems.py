@@ -69,3 +69,6 @@ JOVE_SYSTEMS = {
     "Verge Vendor": ["Raneilles", "Scolluzer", "Tierijev", "Arraron", "Merolles", "Channace", "Alenia", "Adallier", "Claulenne"],
     "Wicked Creek": ["3Q-VZA", "HPBE-D", "R0-DMM", "J-RXYN", "U104-3", "JEQG-7", "5NQI-E", "HD-AJ7", "J7-BDX", "8-OZU1", "G9L-LP", "GPD5-0", "JQU-KY", "4-EFLU", "EIH-IU"]
 }
+
+# Number of Jove Observatory systems per region (for scan completion counts)
+JOVE_REGION_SIZES = {region: len(systems) for region, systems in JOVE_SYSTEMS.items()}
@@ -4,8 +4,12 @@
 #
 # Format: (system1, system2, alliance/coalition)
 # JBs are bidirectional (A->B and B->A work)
+# Add bridges to _JUMPBRIDGE_DATA; any alliance tag is accepted.
+# JUMPBRIDGES is built from it with interned names and the alliance as an index into ALLIANCE_NAMES
 
-JUMPBRIDGES = [
+import sys
+
+_JUMPBRIDGE_DATA = (
     # Cache
     ('C-6YHJ', 'P7-45V', 'FNT'),
     ('I6-SYN', 'YE1-9S', 'FNT'),
@@ -143,7 +147,18 @@ JUMPBRIDGES = [
     ('LP1M-Q', '8G-2FP', 'CONDI'),
     ('R4N-LD', '78-0R6', 'CONDI'),
     ('U-HVIX', 'L-5JCJ', 'CONDI'),
-]
+)
+
+# Alliance/coalition tags, numbered in order of first appearance in the data
+ALLIANCE_IDS = {}
+
+# Immutable; consumers only iterate it
+JUMPBRIDGES = tuple(
+    (sys.intern(system1), sys.intern(system2), ALLIANCE_IDS.setdefault(alliance, len(ALLIANCE_IDS)))
+    for system1, system2, alliance in _JUMPBRIDGE_DATA
+)
+ALLIANCE_NAMES = tuple(ALLIANCE_IDS)
+del _JUMPBRIDGE_DATA
 
 # Travel time assumptions (seconds)
 JB_ACTIVATION_TIME = 10  # Time to activate and jump
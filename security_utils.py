@@ -3,12 +3,43 @@ CHARON Security Utilities
 Input validation, sanitization, and security helpers
 """
 
+import os
 import re
+import time
+import string
 import hashlib
+import functools
 from pathlib import Path
+from collections import OrderedDict
+from urllib.parse import urlparse
 from typing import Optional, Union
 
 
+# Precompiled validator patterns
+_RE_SNOWFLAKE = re.compile(r'^\d{17,20}$')
+_RE_FN_BAD = re.compile(r'[\\/<>:"|?*\x00-\x1f]')
+
+# Buffer size for the calculate_file_hash fallback loop
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Leading characters that make spreadsheets treat a CSV cell as a formula
+_CSV_FORMULA_CHARS = frozenset('=+-@|%')
+
+# Discord markdown characters mapped to their escaped form
+_MD_ESCAPES = str.maketrans({c: '\\' + c for c in '*_~`|>'})
+
+# Name character whitelists as str.translate delete tables; whatever survives
+# translate() must be whitespace (isspace() also covers non-ASCII whitespace)
+_SYSTEM_NAME_CHARS = dict.fromkeys(map(ord, string.ascii_letters + string.digits + string.whitespace + '-'))
+_REGION_NAME_CHARS = dict.fromkeys(map(ord, string.ascii_letters + string.whitespace + "'"))
+
+
+@functools.lru_cache(maxsize=32)
+def _resolved_base(base_dir: Path) -> str:
+    """Resolve a base directory once; callers pass the same few data dirs"""
+    return os.path.realpath(base_dir)
+
+
 class SecurityValidator:
     """Input validation and sanitization utilities"""
     
@@ -21,15 +52,16 @@ class SecurityValidator:
     MAX_INPUT_TEXT_LENGTH = 10000
     
     # Allowed domains for downloads
-    ALLOWED_DOWNLOAD_DOMAINS = [
+    ALLOWED_DOWNLOAD_DOMAINS = frozenset({
         'www.fuzzwork.co.uk',
         'fuzzwork.co.uk'
-    ]
+    })
     
     # CSV injection patterns
-    CSV_FORMULA_CHARS = ['=', '+', '-', '@', '|', '%']
+    CSV_FORMULA_CHARS = _CSV_FORMULA_CHARS
     
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def validate_discord_role_id(role_id: str) -> str:
         """
         Validate Discord role ID (snowflake format)
@@ -39,7 +71,7 @@ class SecurityValidator:
             return ''
         
         # Discord snowflakes are 17-20 digit numbers
-        if not re.match(r'^\d{17,20}$', role_id):
+        if not _RE_SNOWFLAKE.match(role_id):
             return ''
         
         return role_id
@@ -50,14 +82,20 @@ class SecurityValidator:
         Validate EVE system name
         Allows: letters, numbers, spaces, hyphens
         """
+        if not system_name:
+            return None
+        
+        # Strip first so padding neither counts toward the limit nor gets scanned
+        system_name = system_name.strip()
         if not system_name or len(system_name) > SecurityValidator.MAX_SYSTEM_NAME_LENGTH:
             return None
         
         # EVE system names: alphanumeric + hyphen + space
-        if not re.match(r'^[A-Za-z0-9\s\-]+$', system_name):
+        disallowed = system_name.translate(_SYSTEM_NAME_CHARS)
+        if disallowed and not disallowed.isspace():
             return None
         
-        return system_name.strip()
+        return system_name
     
     @staticmethod
     def validate_region_name(region_name: str) -> Optional[str]:
@@ -65,14 +103,20 @@ class SecurityValidator:
         Validate EVE region name
         Allows: letters, spaces, apostrophes
         """
+        if not region_name:
+            return None
+        
+        # Strip first so padding neither counts toward the limit nor gets scanned
+        region_name = region_name.strip()
         if not region_name or len(region_name) > SecurityValidator.MAX_REGION_NAME_LENGTH:
             return None
         
         # EVE region names: letters, spaces, apostrophes
-        if not re.match(r"^[A-Za-z\s']+$", region_name):
+        disallowed = region_name.translate(_REGION_NAME_CHARS)
+        if disallowed and not disallowed.isspace():
             return None
         
-        return region_name.strip()
+        return region_name
     
     @staticmethod
     def sanitize_path(path: Union[str, Path], base_dir: Path) -> Optional[Path]:
@@ -81,21 +125,21 @@ class SecurityValidator:
         Returns None if path is invalid or outside base_dir
         """
         try:
-            path = Path(path)
+            # Resolve to absolute path (realpath still follows symlinks)
+            abs_path = os.path.realpath(path)
+            # Relative bases depend on the cwd, so only absolute ones are cached
+            abs_base = _resolved_base(base_dir) if os.path.isabs(base_dir) else os.path.realpath(base_dir)
             
-            # Resolve to absolute path
-            abs_path = path.resolve()
-            abs_base = base_dir.resolve()
-            
-            # Check if path is within base directory
-            if not str(abs_path).startswith(str(abs_base)):
+            # Check if path is within base directory (a bare prefix test would
+            # also accept sibling directories such as <base>_evil)
+            if os.path.commonpath((abs_path, abs_base)) != abs_base:
                 return None
             
             # Check path length
-            if len(str(abs_path)) > SecurityValidator.MAX_PATH_LENGTH:
+            if len(abs_path) > SecurityValidator.MAX_PATH_LENGTH:
                 return None
             
-            return abs_path
+            return Path(abs_path)
             
         except (ValueError, OSError):
             return None
@@ -109,8 +153,9 @@ class SecurityValidator:
             return None
         
         # Remove path separators and dangerous characters
-        filename = filename.replace('/', '').replace('\\', '').replace('..', '')
-        filename = re.sub(r'[<>:"|?*\x00-\x1f]', '', filename)
+        filename = _RE_FN_BAD.sub('', filename)
+        if '..' in filename:
+            filename = filename.replace('..', '')
         
         if not filename or filename in ['.', '..']:
             return None
@@ -126,11 +171,11 @@ class SecurityValidator:
         if not value:
             return value
         
-        value_str = str(value)
+        value_str = value if type(value) is str else str(value)
         
         # Check if starts with formula character
-        if value_str and value_str[0] in SecurityValidator.CSV_FORMULA_CHARS:
-            return "'" + value_str
+        if value_str and value_str[0] in _CSV_FORMULA_CHARS:
+            return f"'{value_str}"
         
         return value_str
     
@@ -142,23 +187,15 @@ class SecurityValidator:
         if not text:
             return text
         
-        # Escape Discord markdown characters
-        text = text.replace('*', '\\*')
-        text = text.replace('_', '\\_')
-        text = text.replace('~', '\\~')
-        text = text.replace('`', '\\`')
-        text = text.replace('|', '\\|')
-        text = text.replace('>', '\\>')
-        
-        return text
+        # Escape Discord markdown characters in a single pass
+        return text.translate(_MD_ESCAPES)
     
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def validate_url_domain(url: str) -> bool:
         """
         Validate that URL is from an allowed domain
         """
-        from urllib.parse import urlparse
-        
         try:
             parsed = urlparse(url)
             
@@ -182,7 +219,8 @@ class SecurityValidator:
         Safely parse and validate integer with bounds checking
         """
         try:
-            int_val = int(value)
+            # Already-typed ints (e.g. from JSON) skip the parse
+            int_val = value if type(value) is int else int(value)
             
             if min_val is not None and int_val < min_val:
                 return None
@@ -201,7 +239,7 @@ class SecurityValidator:
         Safely parse and validate float with bounds checking
         """
         try:
-            float_val = float(value)
+            float_val = value if type(value) is float else float(value)
             
             if min_val is not None and float_val < min_val:
                 return None
@@ -233,12 +271,18 @@ class SecurityValidator:
         Calculate cryptographic hash of file
         """
         try:
-            hash_func = hashlib.new(algorithm)
-            
             with open(filepath, 'rb') as f:
-                while chunk := f.read(8192):
-                    hash_func.update(chunk)
-            
+                # file_digest (3.11+) hashes straight from the fd without the GIL
+                if hasattr(hashlib, 'file_digest'):
+                    return hashlib.file_digest(f, algorithm).hexdigest()
+
+                # One buffer for the whole file; readinto refills it in place
+                hash_func = hashlib.new(algorithm)
+                buf = bytearray(HASH_CHUNK_SIZE)
+                view = memoryview(buf)
+                while size := f.readinto(buf):
+                    hash_func.update(view[:size])
+
             return hash_func.hexdigest()
             
         except Exception:
@@ -260,34 +304,39 @@ class SecurityValidator:
 class RateLimiter:
     """Simple rate limiter for downloads"""
     
+    # Oldest URLs are forgotten past this many entries
+    MAX_TRACKED_URLS = 4096
+    
     def __init__(self):
-        self.last_download_time = {}
+        self.last_download_time = OrderedDict()
     
     def can_download(self, url: str, cooldown_seconds: int = 3600) -> bool:
         """
         Check if URL can be downloaded (rate limit check)
         cooldown_seconds: Minimum time between downloads (default: 1 hour)
         """
-        import time
-        
-        current_time = time.time()
-        last_time = self.last_download_time.get(url, 0)
+        last_time = self.last_download_time.get(url)
+        if last_time is None:
+            return True
         
-        if current_time - last_time < cooldown_seconds:
+        if time.monotonic() - last_time < cooldown_seconds:
             return False
         
         return True
     
     def record_download(self, url: str):
         """Record that a download occurred"""
-        import time
-        self.last_download_time[url] = time.time()
+        self.last_download_time[url] = time.monotonic()
+        self.last_download_time.move_to_end(url)
+        
+        if len(self.last_download_time) > self.MAX_TRACKED_URLS:
+            self.last_download_time.popitem(last=False)
 
 
 # Global rate limiter instance
-_rate_limiter = RateLimiter()
+RATE_LIMITER = RateLimiter()
 
 
 def get_rate_limiter() -> RateLimiter:
-    """Get global rate limiter instance"""
-    return _rate_limiter
+    """Get global rate limiter instance (kept for callers that predate RATE_LIMITER)"""
+    return RATE_LIMITER
@@ -7,25 +7,46 @@ Run this once to download and process EVE Online static data
 from eve_sde_loader import EVESDELoader
 import sys
 
+# Intro banner, written in one go rather than a print() per line
+INTRO_BANNER = '\n'.join((
+    "=" * 60,
+    "EVE Online Drifter Tracker - SDE Data Setup",
+    "=" * 60,
+    "",
+    "This script will download EVE Online static data including:",
+    "  • Solar system information",
+    "  • Region data",
+    "  • Stargate connections",
+    "  • Ship masses",
+    "",
+    "This is required for advanced routing features.",
+    "Data source: Fuzzwork SDE dumps",
+    "",
+)) + '\n'
+
+
+def _data_summary(loader):
+    """Per-dataset count lines for the loaded SDE"""
+    return (
+        f"  • {len(loader.systems):,} solar systems",
+        f"  • {len(loader.regions)} regions",
+        f"  • {len(loader.system_jumps):,} stargate connections",
+        f"  • {len(loader.ship_masses):,} ship types",
+    )
+
+
+def _write_lines(*lines):
+    """Write a block of lines with a single stdout write"""
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
 def main(silent=False):
     """
     Download and setup SDE data
     silent: If True, skip prompts and just do it
     """
     if not silent:
-        print("=" * 60)
-        print("EVE Online Drifter Tracker - SDE Data Setup")
-        print("=" * 60)
-        print()
-        print("This script will download EVE Online static data including:")
-        print("  • Solar system information")
-        print("  • Region data")
-        print("  • Stargate connections")
-        print("  • Ship masses")
-        print()
-        print("This is required for advanced routing features.")
-        print("Data source: Fuzzwork SDE dumps")
-        print()
+        sys.stdout.write(INTRO_BANNER)
         
         response = input("Continue? (y/n): ")
         if response.lower() != 'y':
@@ -37,13 +58,7 @@ def main(silent=False):
     
     # Check if already processed
     if loader.load_processed_data() and not silent:
-        print()
-        print("✓ SDE data already loaded!")
-        print(f"  • {len(loader.systems):,} solar systems")
-        print(f"  • {len(loader.regions)} regions")
-        print(f"  • {len(loader.system_jumps):,} stargate connections")
-        print(f"  • {len(loader.ship_masses):,} ship types")
-        print()
+        _write_lines("", "✓ SDE data already loaded!", *_data_summary(loader), "")
         response = input("Re-download and process? (y/n): ")
         if response.lower() != 'y':
             print("Using existing data.")
@@ -52,10 +67,7 @@ def main(silent=False):
         # Already have data in silent mode, skip
         return
     
-    print()
-    print("Downloading SDE data files...")
-    print("(This may take a few minutes)")
-    print()
+    _write_lines("", "Downloading SDE data files...", "(This may take a few minutes)", "")
     
     if not loader.download_sde_data():
         print()
@@ -71,19 +83,18 @@ def main(silent=False):
         print("✗ Failed to process SDE data")
         sys.exit(1)
     
-    print()
-    print("=" * 60)
-    print("✓ Setup Complete!")
-    print("=" * 60)
-    print()
-    print(f"Loaded data:")
-    print(f"  • {len(loader.systems):,} solar systems")
-    print(f"  • {len(loader.regions)} regions")
-    print(f"  • {len(loader.system_jumps):,} stargate connections")
-    print(f"  • {len(loader.ship_masses):,} ship types")
-    print()
-    print("Advanced routing features are now available!")
-    print()
+    _write_lines(
+        "",
+        "=" * 60,
+        "✓ Setup Complete!",
+        "=" * 60,
+        "",
+        "Loaded data:",
+        *_data_summary(loader),
+        "",
+        "Advanced routing features are now available!",
+        "",
+    )
     
     # Quick test
     print("Testing pathfinding...")
@@ -2,7 +2,10 @@
 # Ships not in basic SDE but are real EVE ships
 # Mass data from EVE Online (kg)
 
-SPECIAL_EDITION_SHIPS = {
+import sys
+from types import MappingProxyType
+
+_SPECIAL_EDITION_SHIPS = {
     # Alliance Tournament Frigates
     'Cambion': 1_180_000,
     'Malice': 1_180_000,
@@ -33,13 +36,11 @@ SPECIAL_EDITION_SHIPS = {
     'Etana': 16_800_000,
     'Vangel': 13_400_000,
     'Chremoas': 1_180_000,
-    'Moracha': 11_400_000,
+    # Moracha listed with the AT cruisers above
     'Virtuoso': 12_800_000,
     'Victor': 13_400_000,
     'Tiamat': 112_000_000,
-    'Rabisu': 1_180_000,
-    'Laelaps': 11_400_000,
-    'Hydra': 12_200_000,
+    # Rabisu, Laelaps and Hydra listed with the AT frigates/cruisers above
     
     # Pirate Faction (might be missing from basic SDE)
     'Worm': 1_360_000,
@@ -67,3 +68,7 @@ SPECIAL_EDITION_SHIPS = {
     'InterBus Shuttle': 1_000,
     'Zephyr': 5_000_000,
 }
+
+# Read-only view with interned names, matching the interned SDE ship names
+SPECIAL_EDITION_SHIPS = MappingProxyType({sys.intern(name): mass for name, mass in _SPECIAL_EDITION_SHIPS.items()})
+del _SPECIAL_EDITION_SHIPS